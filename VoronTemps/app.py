@@ -1,7 +1,7 @@
-from flask import Flask, render_template, jsonify
-from waitress import serve
+from aiohttp import web
 import aiohttp
 import asyncio
+import jinja2
 import logging
 import os
 import json
@@ -10,9 +10,61 @@ from urllib.parse import urlparse
 import argparse
 import sys
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib if the venv predates orjson.
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; use the stock asyncio loop.
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 
 
+# JSON is (de)serialised on every poll: Moonraker responses in, dashboard
+# payloads out. orjson does both in C and works on bytes directly, which
+# skips a separate UTF-8 decode/encode step.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Request headers for the pre-encoded Moonraker payloads, shared by every POST.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Stand-in for objects missing from a Moonraker status, so lookups don't
+# allocate a fresh empty dict each time. Only ever read, never mutated.
+_NO_STATUS: dict = {}
+
+
+# Responses smaller than this (e.g. /fan) are not worth compressing.
+_COMPRESS_MIN_SIZE = 256
+
+# Seconds between pushes on the /stream Server-Sent Events endpoint.
+_STREAM_INTERVAL = 1.0
+
+# JSON-RPC id of the printer.objects.subscribe request on Moonraker's
+# websocket, and the longest wait between reconnection attempts.
+_SUBSCRIBE_ID = 1
+_SUBSCRIBE_RETRY_MAX = 30.0
+
+
+def _json_response(data) -> web.Response:
+    body = _json_dumps(data)
+    response = web.Response(body=body, content_type="application/json")
+    if len(body) >= _COMPRESS_MIN_SIZE:
+        # Uses gzip/deflate only if the client's Accept-Encoding allows it.
+        response.enable_compression()
+    return response
+
+
 DEFAULT_MOONRAKER_URL = "http://192.168.1.226:7125/printer/objects/query"
 
 
@@ -27,11 +79,10 @@ def _load_moonraker_url_from_config() -> str | None:
     """
 
     cfg_path = Path(__file__).with_name("config.json")
-    if not cfg_path.exists():
-        return None
-
+    # A single open: a missing file raises FileNotFoundError, which the broad
+    # except below turns into None just like any other read/parse error.
     try:
-        data = json.loads(cfg_path.read_text(encoding="utf-8"))
+        data = _json_loads(cfg_path.read_bytes())
     except Exception:
         return None
 
@@ -65,44 +116,100 @@ def resolve_moonraker_url(cli_arg: str | None = None) -> str:
     return DEFAULT_MOONRAKER_URL
 
 
-async def _probe_moonraker(url: str, timeout: float = 5.0) -> bool:
+def _swap_scheme(url: str) -> str | None:
+    """Return ``url`` with http and https swapped, or None if not applicable."""
+    try:
+        p = urlparse(url)
+    except Exception:
+        return None
+    if p.scheme == "https":
+        return p._replace(scheme="http").geturl()
+    if p.scheme == "http":
+        return p._replace(scheme="https").geturl()
+    return None
+
+
+def _websocket_url(url: str) -> str | None:
+    """Return Moonraker's websocket endpoint on the same host as ``url``."""
+    try:
+        p = urlparse(url)
+    except Exception:
+        return None
+    scheme = {"http": "ws", "https": "wss"}.get(p.scheme)
+    if scheme is None or not p.netloc:
+        return None
+    return p._replace(scheme=scheme, path="/websocket", params="", query="", fragment="").geturl()
+
+
+async def _probe_moonraker(url: str, timeout: float = 5.0) -> str | None:
     """Best‑effort connectivity check to the Moonraker API.
 
     This runs once at startup so that a misconfigured / unreachable printer
-    causes the dashboard process to exit immediately instead of happily
-    serving an empty UI on a local port. The launcher will then show an error
-    and OBS won't see a dashboard on that port.
+    is reported in the launcher log straight away. If the configured URL does
+    not answer but the same host does with the other scheme (http vs https),
+    that variant is returned so the fetcher can use it from the first poll.
+
+    Returns the URL that answered, the configured URL on a timeout (treated as
+    a soft failure), or None when Moonraker could not be reached at all.
     """
 
-    payload = {"objects": {}}
+    payload = _json_dumps({"objects": {}})
 
-    # Moonraker is often served with a self-signed certificate. When using
-    # https, we disable SSL verification for this *connectivity probe* only so
-    # that a valid-but-self-signed printer is treated as reachable.
-    try:
-        parsed = urlparse(url)
-    except Exception:
-        parsed = None
+    # Moonraker is often served with a self-signed certificate, so SSL
+    # verification is disabled and a valid-but-self-signed printer is treated
+    # as reachable.
+    connector = aiohttp.TCPConnector(ssl=False)
 
-    connector = None
-    if parsed is not None and parsed.scheme == "https":
-        connector = aiohttp.TCPConnector(ssl=False)
+    async def attempt(session: aiohttp.ClientSession, candidate: str) -> Exception | None:
+        # Errors are returned rather than raised so the caller can tell a
+        # failed scheme from a cancelled one.
+        try:
+            async with session.post(candidate, data=payload, headers=_JSON_HEADERS, timeout=timeout) as resp:
+                # Any 2xx/3xx response is considered "reachable".
+                resp.raise_for_status()
+                return None
+        except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
+            return exc
 
+    candidates = [c for c in (url, _swap_scheme(url)) if c]
+    errors: list[Exception] = []
+    last_exc: Exception | None = None
     try:
+        # Both schemes are probed at once, so a wrong scheme costs one round
+        # trip (or timeout) rather than two in a row. The first scheme to
+        # answer is used and the other request is cancelled; the configured
+        # URL wins if both answer together.
         async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.post(url, json=payload, timeout=timeout) as resp:
-                # Any 2xx/3xx response is considered "reachable".
-                resp.raise_for_status()
-                return True
-    except asyncio.TimeoutError as exc:
-        # Treat pure timeouts as a soft failure: log a warning but allow the
-        # dashboard to start so the user still gets a UI (it will simply show
-        # missing data until Moonraker responds).
-        logging.warning("Moonraker probe timeout for %s: %r – allowing dashboard to start", url, exc)
-        return True
+            tasks = [asyncio.create_task(attempt(session, c)) for c in candidates]
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for candidate, task in zip(candidates, tasks):
+                        if task not in done:
+                            continue
+                        exc = task.result()
+                        if exc is None:
+                            return candidate
+                        errors.append(exc)
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
     except Exception as exc:
-        logging.error("Moonraker probe failed for %s: %r", url, exc)
-        return False
+        last_exc = exc
+    else:
+        if any(isinstance(exc, asyncio.TimeoutError) for exc in errors):
+            # Treat pure timeouts as a soft failure: log a warning but
+            # allow the dashboard to start so the user still gets a
+            # UI (it will simply show missing data until Moonraker
+            # responds).
+            logging.warning("Moonraker probe timeout for %s: %r – allowing dashboard to start", url, errors)
+            return url
+        last_exc = errors[-1] if errors else None
+
+    logging.error("Moonraker probe failed for %s: %r", url, last_exc)
+    return None
 
 class PrinterDataFetcher:
     """Class responsible for fetching data from the 3D printer API."""
@@ -110,75 +217,155 @@ class PrinterDataFetcher:
     def __init__(self, api_url):
         self.api_url = api_url
         # If the configured URL has the wrong scheme (common when users put
-        # https:// for a Moonraker instance that is actually http://), we try
-        # a one-step scheme fallback on request failures and remember the last
-        # working URL.
+        # https:// for a Moonraker instance that is actually http://), the
+        # startup probe resolves the right one (see set_working_url).
+        # Requests always go straight to the working URL; the scheme fallback
+        # only runs when that URL starts failing.
         self._working_url = api_url
 
+        # One long-lived ClientSession per fetcher so every poll reuses the
+        # same keep-alive connection pool instead of paying a fresh TCP
+        # connect (and connector setup) per request. Created lazily on first
+        # use because a session must be built inside its event loop.
+        self._session: aiohttp.ClientSession | None = None
+
         # Last-known-good values so brief Moonraker hiccups don't blank the UI.
         self._last_temperatures: dict[str, dict] = {}
         self._last_progress: dict[str, object] = {"progress_percentage": 0}
         self._last_fan: dict[str, object] = {"fan_speed": 0}
 
+        # Short-lived cache of the combined Moonraker state shared by the
+        # /temperatures, /progress and /fan routes (see _fetch_all).
+        self._cache: dict | None = None
+        self._cache_ts: float = 0.0
+        self._cache_lock = asyncio.Lock()
+        self._cache_ttl = 0.25
+
+        # Status pushed over Moonraker's websocket (see run_subscription).
+        # While a subscription is live, _fetch_all serves from it instead of
+        # POSTing; None means "not subscribed, poll objects/query".
+        self._live_status: dict | None = None
+        self._live_dirty = False
+
         self.temperature_sensors = {
             "extruder": ["temperature", "target"],
             "heater_bed": ["temperature", "target"],
             "temperature_fan MCU_Fans": ["temperature"],
         }
         self.temperature_sensor_variables = ["CHAMBER", "Internals", "NucBox", "NH36", "Cartographer"]
+        # (display name, Moonraker object name) pairs, formatted once.
+        self._sensor_keys = tuple((sensor, f"temperature_sensor {sensor}") for sensor in self.temperature_sensor_variables)
+
+        # Moonraker's objects/query accepts any set of objects in one request,
+        # so every sensor, the print progress and the part fan are fetched
+        # together. The object set never changes, so build and JSON-encode the
+        # payload once instead of re-serialising it on every poll.
+        objects = {
+            **self.temperature_sensors,
+            **{sensor_key: ["temperature"] for _, sensor_key in self._sensor_keys},
+            "virtual_sdcard": ["file_path", "progress", "is_active", "file_position", "file_size"],
+            "fan": ["speed"],
+        }
+        self._state_payload = _json_dumps({"objects": objects})
+        # The same object set, as a websocket subscription request.
+        self._subscribe_request = _json_dumps({
+            "jsonrpc": "2.0",
+            "method": "printer.objects.subscribe",
+            "params": {"objects": objects},
+            "id": _SUBSCRIBE_ID,
+        }).decode("utf-8")
+        self._display_names = {
+            sensor: "MCU" if sensor == "temperature_fan MCU_Fans" else sensor.title().replace("_", " ")
+            for sensor in self.temperature_sensors
+        }
+        # (Moonraker object name, display name, attributes) for the standard
+        # heaters, so parsing is a flat loop with no per-sensor lookups.
+        self._std_sensor_items = tuple(
+            (sensor, self._display_names[sensor], tuple(attributes))
+            for sensor, attributes in self.temperature_sensors.items()
+        )
 
-    def _swap_scheme(self, url: str) -> str | None:
-        try:
-            p = urlparse(url)
-        except Exception:
-            return None
-        if p.scheme == "https":
-            return p._replace(scheme="http").geturl()
-        if p.scheme == "http":
-            return p._replace(scheme="https").geturl()
-        return None
+    def set_working_url(self, url: str) -> None:
+        """Send subsequent requests to ``url`` (e.g. as resolved by the probe)."""
+        self._working_url = url
 
     def _candidate_urls(self) -> list[str]:
         # Order matters: prefer the last known working URL, then the configured
         # URL, then scheme-swapped variants.
         urls: list[str] = []
-        for u in (self._working_url, self.api_url, self._swap_scheme(self._working_url), self._swap_scheme(self.api_url)):
+        for u in (self._working_url, self.api_url, _swap_scheme(self._working_url), _swap_scheme(self.api_url)):
             if isinstance(u, str) and u and u not in urls:
                 urls.append(u)
         return urls
 
-    async def _moonraker_post(self, payload: dict) -> dict | None:
-        """POST a payload to Moonraker with short timeouts and scheme fallback."""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use."""
+
+        if self._session is None or self._session.closed:
+            # ssl=False: Moonraker is often served with a self-signed
+            # certificate, and the scheme fallback below may switch a plain
+            # http URL to https, so one connector has to cope with both.
+            #
+            # The pool is sized for "one host, steady polling": a handful of
+            # connections per host is plenty, idle connections are kept for
+            # 75s (typical reverse-proxy idle timeout) so polls never
+            # re-handshake, and the resolved address is cached for 5 minutes
+            # instead of calling getaddrinfo every 10s.
+            connector = aiohttp.TCPConnector(
+                ssl=False,
+                limit=0,
+                limit_per_host=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=2),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared ClientSession (if one was ever created)."""
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
-        tried: list[str] = []
-        last_exc: Exception | None = None
+    async def _post(self, session: aiohttp.ClientSession, url: str, payload: bytes) -> dict:
+        async with session.post(url, data=payload, headers=_JSON_HEADERS) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
 
-        for url in self._candidate_urls():
-            tried.append(url)
+    async def _moonraker_post(self, payload: bytes) -> dict | None:
+        """POST a pre-encoded JSON payload to Moonraker with short timeouts and scheme fallback."""
 
+        session = await self._get_session()
+        url = self._working_url
+        try:
+            return await self._post(session, url, payload)
+        except asyncio.TimeoutError as exc:
+            # A slow or unreachable printer will not answer on the other
+            # scheme either, so don't double the wait by retrying.
+            logging.error("Moonraker request timed out (url=%s): %r", url, exc)
+            return None
+        except aiohttp.ClientError as exc:
+            last_exc: Exception = exc
+
+        # Cold path: the working URL failed outright (wrong scheme, refused
+        # connection, HTTP error). Try the configured URL and scheme-swapped
+        # variants once and remember whichever answers.
+        tried = [url]
+        for candidate in self._candidate_urls():
+            if candidate in tried:
+                continue
+            tried.append(candidate)
             try:
-                try:
-                    parsed = urlparse(url)
-                except Exception:
-                    parsed = None
-
-                connector = None
-                if parsed is not None and parsed.scheme == "https":
-                    connector = aiohttp.TCPConnector(ssl=False)
-
-                timeout = aiohttp.ClientTimeout(total=2)
-                async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                    async with session.post(url, json=payload) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                # Remember the last successful URL so subsequent requests don't
-                # pay the retry cost.
-                self._working_url = url
-                return data
+                data = await self._post(session, candidate, payload)
             except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
                 last_exc = exc
                 continue
+            self._working_url = candidate
+            return data
 
         logging.error(
             "Moonraker request failed (configured=%s, tried=%s): %r",
@@ -188,104 +375,226 @@ class PrinterDataFetcher:
         )
         return None
     
-    async def fetch_temperature_data(self):
-        """Fetch temperature data from all sensors."""
-        temperatures = {}
+    async def run_subscription(self) -> None:
+        """Keep a websocket subscription to the dashboard's Moonraker objects.
+
+        Moonraker pushes only the fields that changed, so while the socket is
+        up the dashboard stops polling objects/query altogether. If it cannot
+        be opened or drops, polling takes over again and the connection is
+        retried with a growing delay. Runs until cancelled.
+        """
+
+        delay = 1.0
+        log_failure = True
+        while True:
+            url = _websocket_url(self._working_url)
+            if url is None:
+                return
+            try:
+                session = await self._get_session()
+                async with session.ws_connect(url, heartbeat=30) as ws:
+                    await ws.send_str(self._subscribe_request)
+                    await self._consume_updates(ws, url)
+                    # The loop above only ends when Moonraker closes the socket.
+                    delay = 1.0
+                    log_failure = True
+                    logging.warning("Moonraker websocket at %s closed; polling until it reconnects.", url)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, LookupError) as exc:
+                # ValueError/LookupError cover malformed JSON-RPC messages.
+                # Only the first failure of an outage is worth a warning; the
+                # retries would otherwise repeat it every 30s in the launcher.
+                if log_failure:
+                    logging.warning("Moonraker websocket unavailable at %s (%s); polling instead.", url, exc)
+                    log_failure = False
+            finally:
+                self._end_live_status()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _SUBSCRIBE_RETRY_MAX)
+
+    async def _consume_updates(self, ws: aiohttp.ClientWebSocketResponse, url: str) -> None:
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+            message = _json_loads(msg.data)
+            method = message.get("method")
+
+            if method == "notify_status_update":
+                # params is [changed fields per object, eventtime].
+                live = self._live_status
+                if live is not None:
+                    for name, fields in message["params"][0].items():
+                        live.setdefault(name, {}).update(fields)
+                    self._live_dirty = True
+            elif method == "notify_klippy_ready":
+                # Klipper restarted: subscribe again to get a fresh full status.
+                await ws.send_str(self._subscribe_request)
+            elif method in ("notify_klippy_shutdown", "notify_klippy_disconnected"):
+                # No updates will arrive; polling keeps serving the
+                # last-known-good values until Klipper is back.
+                self._end_live_status()
+            elif message.get("id") == _SUBSCRIBE_ID:
+                result = message.get("result")
+                if result is None:
+                    logging.warning("Moonraker rejected the status subscription: %r", message.get("error"))
+                    self._live_status = None
+                    continue
+                if self._live_status is None:
+                    logging.info("Subscribed to Moonraker status updates at %s", url)
+                self._live_status = result.get("status") or {}
+                self._live_dirty = True
+
+    def _end_live_status(self) -> None:
+        """Stop serving pushed status and hand over to polling."""
+        # Pushed status is only parsed when read, so fold in anything unread
+        # to keep it as the last-known-good values.
+        if self._live_status is not None and self._live_dirty:
+            self._live_dirty = False
+            self._update_cache(self._live_status)
+        self._live_status = None
+
+    def _update_cache(self, status: dict | None) -> dict:
+        """Parse ``status`` (if any) and cache the combined dashboard state."""
+        if status is not None:
+            self._parse_temperatures(status)
+            self._parse_progress(status)
+            self._parse_fan(status)
+
+        # On failure the last-known-good values are served (and cached) so
+        # brief Moonraker hiccups don't blank the UI or trigger a burst of
+        # retries from every route.
+        self._cache = {
+            "temperatures": self._last_temperatures,
+            "progress": self._last_progress,
+            "fan": self._last_fan,
+        }
+        self._cache_ts = asyncio.get_running_loop().time()
+        return self._cache
+
+    async def _fetch_all(self) -> dict:
+        """Return temperatures, progress and fan speed from one Moonraker query.
 
+        While the websocket subscription is live, the pushed status is parsed
+        (only when it has changed) and no request is made at all.
+
+        Otherwise the browser's requests are served from a single
+        objects/query whose decoded result is cached for ``_cache_ttl``
+        seconds. Concurrent callers wait on the lock and share the in-flight
+        request.
+        """
+
+        live = self._live_status
+        if live is not None:
+            if self._live_dirty:
+                self._live_dirty = False
+                return self._update_cache(live)
+            return self._cache
+
+        # Fast path: a fresh cache is returned without touching the lock, so
+        # cache hits never suspend. Everything runs on one event loop thread,
+        # and both attributes are only reassigned (never mutated) below.
+        loop = asyncio.get_running_loop()
+        cache = self._cache
+        if cache is not None and loop.time() - self._cache_ts < self._cache_ttl:
+            return cache
+
+        async with self._cache_lock:
+            # Another caller may have refreshed the cache while we waited.
+            if self._cache is not None and loop.time() - self._cache_ts < self._cache_ttl:
+                return self._cache
+
+            data = await self._moonraker_post(self._state_payload)
+            status = None
+            if data:
+                logging.debug("API response: %s", data)
+                status = (data.get("result") or _NO_STATUS).get("status") or _NO_STATUS
+            return self._update_cache(status)
+
+    def _parse_temperatures(self, status: dict) -> None:
+        temperatures = {}
         try:
-            # Fetch standard sensors
-            payload_standard = {"objects": self.temperature_sensors}
-            data_standard = await self._moonraker_post(payload_standard)
-            if not data_standard:
-                return self._last_temperatures
-
-            sensors_data = data_standard.get("result", {}).get("status", {})
-            for sensor, attributes in self.temperature_sensors.items():
-                sensor_data = sensors_data.get(sensor, {})
-                display_name = "MCU" if sensor == "temperature_fan MCU_Fans" else sensor.title().replace("_", " ")
+            for sensor, display_name, attributes in self._std_sensor_items:
+                sensor_data = status.get(sensor, _NO_STATUS)
                 temperatures[display_name] = {attr: sensor_data.get(attr, "N/A") for attr in attributes}
 
-            # Fetch temperature_sensor variables
-            payload_variables = {
-                "objects": {f"temperature_sensor {sensor}": ["temperature"] for sensor in self.temperature_sensor_variables}
-            }
-            data_variables = await self._moonraker_post(payload_variables)
-            if not data_variables:
-                # Keep the standard temps we already have if the variable query
-                # fails.
-                self._last_temperatures = temperatures or self._last_temperatures
-                return self._last_temperatures
-
-            sensor_variables_data = data_variables.get("result", {}).get("status", {})
-            for sensor in self.temperature_sensor_variables:
-                sensor_key = f"temperature_sensor {sensor}"
-                temperature = sensor_variables_data.get(sensor_key, {}).get("temperature", "N/A")
+            for sensor, sensor_key in self._sensor_keys:
+                temperature = status.get(sensor_key, _NO_STATUS).get("temperature", "N/A")
                 temperatures[sensor] = {"temperature": temperature, "target": "N/A"}
 
             self._last_temperatures = temperatures
-            return temperatures
         except Exception as e:
-            logging.error(f"Error fetching temperature data from Moonraker API: {e}")
-            return self._last_temperatures
+            logging.error(f"Error parsing temperature data from Moonraker API: {e}")
 
-    async def fetch_progress_data(self):
-        """Fetch print job progress data."""
+    def _parse_progress(self, status: dict) -> None:
         try:
-            payload = {"objects": {"virtual_sdcard": ["file_path", "progress", "is_active", "file_position", "file_size"]}}
-            data = await self._moonraker_post(payload)
-            if not data:
-                return self._last_progress
-
-            logging.debug("API response: %s", data)
-
-            progress_data = data.get("result", {}).get("status", {}).get("virtual_sdcard", {})
-            progress = {
+            progress_data = status.get("virtual_sdcard", _NO_STATUS)
+            self._last_progress = {
                 "progress_percentage": round((progress_data.get("progress") or 0) * 100, 1),
                 "file_path": progress_data.get("file_path", "N/A"),
                 "is_active": progress_data.get("is_active", False),
                 "file_position": progress_data.get("file_position", 0),
                 "file_size": progress_data.get("file_size", 0)
             }
-            self._last_progress = progress
-            return progress
         except Exception as e:
-            logging.error(f"Error fetching progress data from Moonraker API: {e}")
-            return self._last_progress
+            logging.error(f"Error parsing progress data from Moonraker API: {e}")
+
+    def _parse_fan(self, status: dict) -> None:
+        try:
+            speed_fraction = status.get("fan", _NO_STATUS).get("speed", 0)
+            # Convert 0.0-1.0 to 0-100%
+            self._last_fan = {"fan_speed": round(speed_fraction * 100, 1)}
+        except Exception as e:
+            logging.error(f"Error parsing fan data from Moonraker API: {e}")
+
+    async def fetch_temperature_data(self):
+        """Fetch temperature data from all sensors."""
+        return (await self._fetch_all())["temperatures"]
+
+    async def fetch_progress_data(self):
+        """Fetch print job progress data."""
+        return (await self._fetch_all())["progress"]
 
     async def fetch_fan_data(self):
         """
         Fetch cooling fan speed data. 
         Returns fan speed as a percentage (0-100).
         """
-        fan_data = {"fan_speed": 0}
-        payload = {"objects": {"fan": ["speed"]}}
-        try:
-            data = await self._moonraker_post(payload)
-            if not data:
-                return self._last_fan
+        return (await self._fetch_all())["fan"]
 
-            fan_status = data.get("result", {}).get("status", {}).get("fan", {})
-            speed_fraction = fan_status.get("speed", 0)
-            # Convert 0.0-1.0 to 0-100%
-            fan_data["fan_speed"] = round(speed_fraction * 100, 1)
-            self._last_fan = fan_data
-            return fan_data
-        except Exception as e:
-            logging.error(f"Error fetching fan data from Moonraker API: {e}")
-            return self._last_fan
+    async def fetch_state_data(self) -> dict:
+        """Return temperatures, progress and fan speed together."""
+        return await self._fetch_all()
 
 
 class PrinterDashboardApp:
-    """Class that defines the Flask application for the 3D printer dashboard."""
+    """Class that defines the aiohttp application for the 3D printer dashboard."""
     
     def __init__(self, api_url):
-        self.app = Flask(__name__)
+        # Everything runs on aiohttp's single asyncio loop: the async views
+        # run directly on it and share the fetcher's ClientSession (and its
+        # pooled connections) across requests.
+        self.app = web.Application()
         self.data_fetcher = PrinterDataFetcher(api_url)
+        self._moonraker_task: asyncio.Task | None = None
+        # Set on shutdown so open /stream responses finish straight away
+        # instead of holding the server open until aiohttp's shutdown timeout.
+        self._closing = asyncio.Event()
+        self.app.on_startup.append(self._on_startup)
+        self.app.on_shutdown.append(self._on_shutdown)
+        self.app.on_cleanup.append(self._on_cleanup)
+
+        # Templates are never edited while the dashboard runs, so skip
+        # Jinja's per-lookup mtime check.
+        self.templates = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(Path(__file__).with_name("templates")),
+            autoescape=jinja2.select_autoescape(["html"]),
+            auto_reload=False,
+        )
 
         # Expose the launcher label (if provided) so templates can show which
         # printer this dashboard instance belongs to. This is useful when the
         # same script is run multiple times (Voron 1, Voron 2, etc.).
-        self.app.config["PRINTER_LABEL"] = os.environ.get("LAUNCHER_TOOL_LABEL") or "Voron"
+        self.printer_label = os.environ.get("LAUNCHER_TOOL_LABEL") or "Voron"
 
         # Also expose a friendly Moonraker host:port string so each dashboard
         # instance is clearly tied to its backend printer in OBS.
@@ -300,51 +609,143 @@ class PrinterDashboardApp:
         except Exception:
             host = api_url
 
-        self.app.config["MOONRAKER_URL"] = api_url
-        self.app.config["MOONRAKER_HOST"] = host
+        self.moonraker_url = api_url
+        self.moonraker_host = host
 
         self._register_routes()
-    
+
+    async def _on_startup(self, app: web.Application) -> None:
+        """Start request tasks eagerly where the interpreter supports it.
+
+        On Python 3.12+ an eager task runs synchronously until its first real
+        suspension, so a handler answered from the fetcher's cache completes
+        without being scheduled for a later loop iteration. Older Pythons
+        keep the default task factory.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+        # Probe Moonraker in the background so the port is bound immediately
+        # instead of after up to several seconds of probe timeouts.
+        self._moonraker_task = asyncio.create_task(self._watch_moonraker())
+
+    async def _watch_moonraker(self) -> None:
+        """Probe Moonraker, then subscribe to its status updates."""
+        # The probe goes first so the subscription uses the scheme it found.
+        await self._probe()
+        await self.data_fetcher.run_subscription()
+
+    async def _probe(self) -> None:
+        """Log Moonraker reachability and adopt the scheme that answers.
+
+        The probe is for logging/diagnostics only; it never prevents the
+        dashboard from serving. This avoids any chance that transient network
+        issues or HTTPS quirks stop the local UI from binding to its port.
+        """
+        url = self.moonraker_url
+        try:
+            working_url = await _probe_moonraker(url)
+        except Exception as exc:
+            logging.warning("Moonraker probe raised %r – ignoring.", exc)
+            return
+
+        if working_url is None:
+            logging.warning("Moonraker at %s appears unreachable (probe failed). Dashboard is still running.", url)
+        elif working_url != url:
+            logging.info("Moonraker answered on %s; using that instead of %s", working_url, url)
+            self.data_fetcher.set_working_url(working_url)
+
+    async def _on_shutdown(self, app: web.Application) -> None:
+        """End any open /stream responses."""
+        self._closing.set()
+
+    async def _on_cleanup(self, app: web.Application) -> None:
+        """Close the shared Moonraker session when the server shuts down."""
+        if self._moonraker_task is not None:
+            self._moonraker_task.cancel()
+            # Let the websocket close before its session does.
+            await asyncio.gather(self._moonraker_task, return_exceptions=True)
+        await self.data_fetcher.close()
+
     def _register_routes(self):
-        """Register all the Flask routes."""
+        """Register all the HTTP routes."""
         
-        @self.app.route('/progress')
-        async def get_progress():
+        async def get_progress(request):
             progress = await self.data_fetcher.fetch_progress_data()
-            return jsonify(progress)
+            return _json_response(progress)
             
-        @self.app.route("/temperatures")
-        async def get_temperatures():
+        async def get_temperatures(request):
             temperatures = await self.data_fetcher.fetch_temperature_data()
-            return jsonify(temperatures)
+            return _json_response(temperatures)
 
-        @self.app.route('/fan')
-        async def get_fan_speed():
+        async def get_fan_speed(request):
             """Return the current fan speed in percentage."""
             fan_data = await self.data_fetcher.fetch_fan_data()
-            return jsonify(fan_data)
-
-        @self.app.route('/')
-        async def index():
-            # Do not block initial page render on Moonraker I/O.
-            # The frontend already polls /temperatures, /fan, /progress.
-            temperatures = {}
-            fan_data = {"fan_speed": 0}
-            label = self.app.config.get("PRINTER_LABEL", "Voron")
-            moonraker_host = self.app.config.get("MOONRAKER_HOST", "unknown")
-            return render_template(
-                'index.html',
-                temperatures=temperatures,
-                fan_data=fan_data,
-                printer_label=label,
-                moonraker_host=moonraker_host,
-            )
+            return _json_response(fan_data)
+
+        async def stream(request):
+            """Push the combined printer state as Server-Sent Events.
+
+            One long-lived response per browser replaces its three polled
+            routes. Every client wakes on the same interval boundary, so they
+            all share a single cached Moonraker query per tick.
+            """
+            response = web.StreamResponse(headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+            })
+            await response.prepare(request)
+
+            loop = asyncio.get_running_loop()
+            try:
+                while not self._closing.is_set():
+                    state = await self.data_fetcher.fetch_state_data()
+                    await response.write(b"data: " + _json_dumps(state) + b"\n\n")
+                    try:
+                        await asyncio.wait_for(
+                            self._closing.wait(),
+                            _STREAM_INTERVAL - loop.time() % _STREAM_INTERVAL,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+            except ConnectionResetError:
+                # The browser went away (tab closed or reloaded).
+                pass
+            return response
+
+        # Do not block initial page render on Moonraker I/O: the page is an
+        # empty skeleton and the frontend gets its data from /stream (or by
+        # polling /temperatures, /fan and /progress as a fallback).
+        # Everything it is rendered with is fixed for the lifetime of the
+        # process, so render it once up front.
+        index_html = self.templates.get_template('index.html').render(
+            temperatures={},
+            fan_data={"fan_speed": 0},
+            printer_label=self.printer_label,
+            moonraker_host=self.moonraker_host,
+        )
+
+        async def index(request):
+            response = web.Response(text=index_html, content_type="text/html")
+            response.enable_compression()
+            return response
+
+        self.app.router.add_get('/progress', get_progress)
+        self.app.router.add_get('/temperatures', get_temperatures)
+        self.app.router.add_get('/fan', get_fan_speed)
+        self.app.router.add_get('/stream', stream)
+        self.app.router.add_get('/', index)
     
     def run(self, host="127.0.0.1", port=5000):
-        """Run the Flask application via a production WSGI server (waitress)."""
-        # `threads` keeps async view functions responsive enough for this small
-        # dashboard and avoids Flask's development server.
-        serve(self.app, host=host, port=port, threads=8)
+        """Run the dashboard on aiohttp's asyncio web server."""
+        # Per-request access logging is disabled: the browser polls several
+        # routes every few seconds and the launcher shows this process's
+        # output live.
+        # On POSIX the server runs on uvloop (libuv) when it is installed,
+        # which has cheaper I/O wake-ups than the default selector loop.
+        loop = uvloop.new_event_loop() if uvloop is not None else None
+        web.run_app(self.app, host=host, port=port, access_log=None, loop=loop)
 
 
 # Main application entry point
@@ -363,13 +764,13 @@ if __name__ == "__main__":
     parser.add_argument(
         "--host",
         default="127.0.0.1",
-        help="Host interface for the Flask server (default: 127.0.0.1)",
+        help="Host interface for the dashboard server (default: 127.0.0.1)",
     )
     parser.add_argument(
         "--port",
         type=int,
         default=5000,
-        help="Port for the Flask server (default: 5000)",
+        help="Port for the dashboard server (default: 5000)",
     )
     # Debug flag intentionally removed/ignored for packaged usage.
 
@@ -378,16 +779,5 @@ if __name__ == "__main__":
     moonraker_url = resolve_moonraker_url(args.moonraker_url)
     logging.info("Using Moonraker API URL: %s", moonraker_url)
 
-    # Only use the probe for logging/diagnostics now; do *not* prevent the
-    # dashboard from starting. This avoids any chance that transient network
-    # issues or HTTPS quirks stop the local UI from binding to its port.
-    try:
-        ok = asyncio.run(_probe_moonraker(moonraker_url))
-        if not ok:
-            logging.warning("Moonraker at %s appears unreachable (probe failed). Dashboard will still start.", moonraker_url)
-    except Exception as exc:
-        logging.warning("Moonraker probe raised %r – ignoring and starting dashboard anyway.", exc)
-
     app = PrinterDashboardApp(moonraker_url)
-    # Run with a production WSGI server.
     app.run(host=args.host, port=args.port)
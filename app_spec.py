@@ -64,11 +64,17 @@ class AppSpec:
     # Optional behavioural hint used by the UI/runner; for example
     # "oneshot" hides the Stop button and uses a different label.
     kind: str = "normal"
+    # Let the child write its output directly to the log file (see
+    # ToolEntry.silent).
+    silent: bool = False
     # Optional per-tool Moonraker settings for Klipper dashboards.
     # When provided, the launcher will inject MOONRAKER_API_URL into the
     # child process environment and pass "--port" on the command line.
     moonraker_url: str | None = None
     moonraker_port: int | None = None
+    # Id of the tools_config.json entry this spec was built from, so the
+    # main window can match cards to entries across config reloads.
+    tool_id: str = ""
 
     @property
     def venv_python(self) -> Path:
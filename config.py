@@ -1,22 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from hashlib import blake2b
 from pathlib import Path
 import json
+import os
 
-from app_spec import BASE_DIR
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib if the venv predates orjson.
+    orjson = None
+
+from app_spec import AppSpec, BASE_DIR
 
 
 CONFIG_FILENAME = "tools_config.json"
 
 
-@dataclass
+# orjson parses/serialises bytes directly in C, so reading the config skips
+# the separate UTF-8 decode and the pure-Python tokenizer.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+
+@dataclass(slots=True, frozen=True)
 class ToolEntry:
     """Persistent configuration for one launcher tool/printer.
 
     This is intentionally a superset of what AppSpec needs so that the
     launcher can drive special UI behaviour (e.g. one-shot tools) without
     hard-coding names.
+
+    Entries are immutable (edit with ``dataclasses.replace``) and slotted, so
+    the per-instance ``__dict__`` is gone.
     """
 
     id: str
@@ -26,19 +50,50 @@ class ToolEntry:
     # Behaviour hint for the UI/runner; e.g. "normal" vs "oneshot".
     kind: str = "normal"
     enabled: bool = True
+    # Send the tool's output straight to its log file instead of through the
+    # launcher; the GUI log then only shows it by tailing that file.
+    silent: bool = False
     # Optional Moonraker API URL for Klipper-based tools. When set, the
     # launcher will expose it to the child process via MOONRAKER_API_URL so
     # that a single script can target different printers.
     moonraker_url: str | None = None
-    # Optional Moonraker API TCP port (default 7125). This is stored
-    # separately so the UI can show a simple "IP/host + port" model.
-    moonraker_api_port: int | None = None
-    # Optional local dashboard port for Flask-based tools such as the
+    # Moonraker API TCP port. This is stored separately so the UI can show a
+    # simple "IP/host + port" model; configs without it get the default.
+    moonraker_api_port: int = 7125
+    # Optional local dashboard port for web dashboard tools such as the
     # Voron/Klipper dashboard. When provided, the launcher will add a
     # "--port" argument so multiple dashboards can be run concurrently.
     moonraker_port: int | None = None
 
 
+# Field names in declaration order, for serialising entries. ToolEntry only
+# holds flat values, so a plain getattr projection does what asdict() does
+# without its recursive deepcopy of every value.
+_FIELDS = tuple(f.name for f in fields(ToolEntry))
+
+
+# Last parsed config, keyed by the file's (mtime_ns, size) when it was read.
+# Both the launcher and the Manage Tools dialog load the config, usually
+# without it having changed in between.
+_tools_cache: tuple[tuple[int, int], list[ToolEntry]] | None = None
+
+# Digest of the config file's bytes, keyed the same way. Lets a save that
+# would write back identical content skip touching the disk.
+_file_digest: tuple[tuple[int, int], bytes] | None = None
+
+
+def _digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=16).digest()
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def config_path() -> Path:
     return BASE_DIR / CONFIG_FILENAME
 
@@ -77,18 +132,40 @@ def _default_tools() -> list[ToolEntry]:
     ]
 
 
+def _parse_port(value) -> int | None:
+    """Return a port stored as an int or a digit string, else None."""
+
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdigit():
+            return int(value)
+    return None
+
+
 def load_tools_config() -> list[ToolEntry]:
     """Load tool configuration from JSON, falling back to defaults.
 
-    Any invalid entries are skipped. Unknown keys are ignored.
+    Any invalid entries are skipped. Unknown keys are ignored. Repeat calls
+    while the file is unchanged return the previously parsed entries.
     """
 
+    global _tools_cache, _file_digest
+
     path = config_path()
-    if not path.exists():
+    key = _stat_key(path)
+    if key is None:
         return _default_tools()
 
+    if _tools_cache is not None and _tools_cache[0] == key:
+        # Entries are frozen, so only the list itself needs copying.
+        return list(_tools_cache[1])
+
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+        _file_digest = (key, _digest(data))
+        raw = _json_loads(data)
     except Exception:
         # Corrupt or unreadable file – treat as if missing, but *do not*
         # overwrite the broken file automatically.
@@ -103,68 +180,89 @@ def load_tools_config() -> list[ToolEntry]:
         if not isinstance(obj, dict):
             continue
         try:
-            tid = str(obj.get("id") or "").strip()
-            label = str(obj.get("label") or "").strip()
-            project_dir = str(obj.get("project_dir") or "").strip()
-            script = str(obj.get("script") or "").strip()
-            kind = str(obj.get("kind") or "normal").strip() or "normal"
-            enabled = bool(obj.get("enabled", True))
-
-            moonraker_url_val = obj.get("moonraker_url")
-            if isinstance(moonraker_url_val, str):
-                moonraker_url = moonraker_url_val.strip() or None
-            else:
-                moonraker_url = None
-
-            api_port_raw = obj.get("moonraker_api_port")
-            moonraker_api_port: int | None
-            if isinstance(api_port_raw, int):
-                moonraker_api_port = api_port_raw
-            elif isinstance(api_port_raw, str) and api_port_raw.strip().isdigit():
-                moonraker_api_port = int(api_port_raw.strip())
-            else:
-                moonraker_api_port = None
-
-            port_raw = obj.get("moonraker_port")
-            moonraker_port: int | None
-            if isinstance(port_raw, int):
-                moonraker_port = port_raw
-            elif isinstance(port_raw, str) and port_raw.strip().isdigit():
-                moonraker_port = int(port_raw.strip())
-            else:
-                moonraker_port = None
-
+            get = obj.get
+            tid = str(get("id") or "").strip()
+            label = str(get("label") or "").strip()
+            project_dir = str(get("project_dir") or "").strip()
+            script = str(get("script") or "").strip()
+            # Check the required fields before coercing the optional ones.
             if not tid or not label or not project_dir or not script:
                 continue
 
+            moonraker_url = get("moonraker_url")
             tools.append(
                 ToolEntry(
                     id=tid,
                     label=label,
                     project_dir=project_dir,
                     script=script,
-                    kind=kind,
-                    enabled=enabled,
-                    moonraker_api_port=moonraker_api_port,
-                    moonraker_url=moonraker_url,
-                    moonraker_port=moonraker_port,
+                    kind=str(get("kind") or "normal").strip() or "normal",
+                    enabled=bool(get("enabled", True)),
+                    silent=bool(get("silent", False)),
+                    moonraker_api_port=_parse_port(get("moonraker_api_port")) or 7125,
+                    moonraker_url=(moonraker_url.strip() or None) if isinstance(moonraker_url, str) else None,
+                    moonraker_port=_parse_port(get("moonraker_port")),
                 )
             )
         except Exception:
             # Skip any entry that cannot be parsed cleanly
             continue
 
-    return tools or _default_tools()
+    tools = tools or _default_tools()
+    _tools_cache = (key, tools)
+    return list(tools)
 
 
 def save_tools_config(tools: list[ToolEntry]) -> None:
-    """Persist the given tools list to JSON on disk."""
+    """Persist the given tools list to JSON on disk.
+
+    Nothing is written if the file already holds exactly this content.
+    Otherwise the file is replaced atomically, so a crash mid-save cannot
+    leave a truncated config behind.
+    """
+
+    global _tools_cache, _file_digest
 
     path = config_path()
     payload = {
-        "tools": [asdict(t) for t in tools],
+        "tools": [{name: getattr(t, name) for name in _FIELDS} for t in tools],
     }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    data = _json_dumps(payload)
+    digest = _digest(data)
+    if _file_digest is not None and _file_digest[1] == digest:
+        if _stat_key(path) == _file_digest[0]:
+            return
+
+    # Drop the cache even though the mtime changes too: on filesystems with
+    # coarse timestamps a quick re-save could otherwise look unchanged.
+    _tools_cache = None
+    _file_digest = None
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+    key = _stat_key(path)
+    if key is not None:
+        _file_digest = (key, digest)
+
+
+def build_app_specs(tools: list[ToolEntry]) -> list[AppSpec]:
+    """Return the AppSpec for each enabled tool, in config order."""
+
+    return [
+        AppSpec(
+            name=t.label,
+            project_dir=BASE_DIR / t.project_dir,
+            script=t.script,
+            kind=t.kind,
+            silent=t.silent,
+            moonraker_url=t.moonraker_url,
+            moonraker_port=t.moonraker_port,
+            tool_id=t.id,
+        )
+        for t in tools
+        if t.enabled
+    ]
 
 
 def ensure_config_exists() -> None:
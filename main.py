@@ -6,8 +6,8 @@ from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 
-from app_spec import AppSpec, BASE_DIR
-from config import ensure_config_exists, load_tools_config
+from app_spec import AppSpec
+from config import build_app_specs, ensure_config_exists, load_tools_config
 from main_window import MainWindow
 
 
@@ -20,24 +20,7 @@ def build_specs() -> list[AppSpec]:
     """
 
     ensure_config_exists()
-    tools = load_tools_config()
-
-    specs: list[AppSpec] = []
-    for t in tools:
-        if not t.enabled:
-            continue
-        specs.append(
-            AppSpec(
-                name=t.label,
-                project_dir=BASE_DIR / t.project_dir,
-                script=t.script,
-                kind=t.kind,
-                moonraker_url=t.moonraker_url,
-                moonraker_port=t.moonraker_port,
-            )
-        )
-
-    return specs
+    return build_app_specs(load_tools_config())
 
 
 def main() -> int:
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import QSize, Qt
+from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtGui import QDesktopServices, QAction
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -19,9 +19,8 @@ from PySide6.QtWidgets import (
 )
 
 from app_spec import AppSpec, BASE_DIR
-from config import load_tools_config
+from config import build_app_specs, load_tools_config
 from runner_widget import AppRunner
-from manage_tools_dialog import ManageToolsDialog
 from styles import build_styles
 
 
@@ -34,7 +33,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(QSize(980, 700))
 
         self.theme = "dark"
-        self.setStyleSheet(build_styles(self.theme))
+        # The theme currently applied. Setting a stylesheet makes Qt re-parse
+        # it and re-polish every child widget, so it is never re-applied as-is
+        # (build_styles itself caches the text per theme).
+        self._applied_theme: str | None = None
+        self._apply_styles(self.theme)
 
         # Log view
         self.log_view = QPlainTextEdit()
@@ -43,6 +46,18 @@ class MainWindow(QMainWindow):
         # the side of the screen.
         self.log_view.setLineWrapMode(QPlainTextEdit.WidgetWidth)
         self.log_view.setObjectName("LogView")
+        # Keep only the most recent lines so long sessions don't grow the
+        # document (and its relayout cost) without bound.
+        self.log_view.setMaximumBlockCount(5000)
+
+        # Child process output is buffered and appended at most once per
+        # frame (~16ms) instead of once per read, so a chatty tool costs one
+        # relayout/repaint per frame rather than one per line.
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(16)
+        self._log_timer.timeout.connect(self._flush_log)
 
         # Root layout
         central = QWidget()
@@ -91,7 +106,7 @@ class MainWindow(QMainWindow):
         self.btn_start_all.clicked.connect(self.start_all)
         self.btn_stop_all.clicked.connect(self.stop_all)
         self.btn_open_logs.clicked.connect(self.open_all_logs)
-        self.btn_clear.clicked.connect(self.log_view.clear)
+        self.btn_clear.clicked.connect(self.clear_log)
         self.btn_manage_printers.clicked.connect(self.open_manage_tools)
 
         self.btn_light.clicked.connect(lambda: self.set_theme("light"))
@@ -200,7 +215,7 @@ class MainWindow(QMainWindow):
         """Switch between light and dark themes and update toggle state."""
 
         self.theme = theme
-        self.setStyleSheet(build_styles(self.theme))
+        self._apply_styles(theme)
 
         # Highlight active icon button so you can see current theme
         if hasattr(self, "btn_light") and hasattr(self, "btn_dark"):
@@ -210,12 +225,35 @@ class MainWindow(QMainWindow):
                 btn.style().unpolish(btn)
                 btn.style().polish(btn)
 
+    def _apply_styles(self, theme: str) -> None:
+        if theme == self._applied_theme:
+            return
+        self.setStyleSheet(build_styles(theme))
+        self._applied_theme = theme
+
     def append_log(self, app_name: str, text: str) -> None:
-        if text.strip() and "\n" not in text.strip("\n"):
-            line = f"[{app_name}] {text}"
+        # Single-line output goes on the same line as the tag, anything else
+        # below it. Trailing newlines are trimmed once up front, and the
+        # checks run on that one copy instead of re-stripping the whole text.
+        body = text.rstrip("\n")
+        if "\n" not in body.lstrip("\n") and body and not body.isspace():
+            line = f"[{app_name}] {body}"
+        elif body:
+            line = f"[{app_name}]\n{body}"
         else:
-            line = f"[{app_name}]\n{text}"
-        self.log_view.appendPlainText(line.rstrip("\n"))
+            line = f"[{app_name}]"
+        self._log_buf.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_buf:
+            self.log_view.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
+
+    def clear_log(self) -> None:
+        self._log_buf.clear()
+        self.log_view.clear()
 
     def start_all(self) -> None:
         for r in self.runners:
@@ -249,28 +287,66 @@ class MainWindow(QMainWindow):
         """Open the Manage Tools dialog.
         """
 
+        # Imported on first use: the dialog is rarely opened, so its module
+        # isn't loaded before the main window is shown.
+        from manage_tools_dialog import ManageToolsDialog
+
         dlg = ManageToolsDialog(self, on_saved=self._reload_tools_from_config)
         dlg.exec()
 
     # ---- Dynamic tools management ----
 
     def _build_runners(self, specs: list[AppSpec]) -> None:
-        """(Re)build the AppRunner cards list from the given specs."""
-
-        # Clear existing widgets from the layout
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-
-        self.runners = []
-        for spec in specs:
-            runner = AppRunner(spec, self.append_log)
-            self.runners.append(runner)
-            self.cards_layout.addWidget(runner)
-
-        self.cards_layout.addStretch(1)
+        """(Re)build the AppRunner cards list from the given specs.
+
+        Cards are matched to specs by tool id: an existing card is updated in
+        place (keeping any process it is running) and moved to its new
+        position, and only cards for new or removed tools are created or torn
+        down.
+        """
+
+        # Suspend painting while cards are swapped so the container is laid
+        # out and repainted once at the end rather than after every change.
+        container = self.cards_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            # Ids should be unique, but a hand-edited config can repeat one;
+            # keep every card per id and hand them out in their old order.
+            existing: dict[str, list[AppRunner]] = {}
+            for r in self.runners:
+                if r.spec.tool_id:
+                    existing.setdefault(r.spec.tool_id, []).append(r)
+
+            # Empty the layout, last item first so the layout never has to
+            # shift the remaining items down. Cards stay parented to the
+            # container, so reused ones are simply re-added below.
+            for i in range(self.cards_layout.count() - 1, -1, -1):
+                self.cards_layout.takeAt(i)
+
+            runners: list[AppRunner] = []
+            for spec in specs:
+                matches = existing.get(spec.tool_id) if spec.tool_id else None
+                runner = matches.pop(0) if matches else None
+                if runner is None:
+                    runner = AppRunner(spec, self.append_log)
+                else:
+                    runner.update_spec(spec)
+                runners.append(runner)
+                self.cards_layout.addWidget(runner)
+
+            self.cards_layout.addStretch(1)
+
+            # Whatever wasn't matched belongs to a tool that was removed or
+            # disabled (or has no id to match on) and is dropped as before.
+            kept = {id(r) for r in runners}
+            for r in self.runners:
+                if id(r) not in kept:
+                    r.setParent(None)
+            self.runners = runners
+        finally:
+            container.setUpdatesEnabled(True)
+            container.updateGeometry()
+
         self._refresh_all_buttons()
 
     def _reload_tools_from_config(self) -> None:
@@ -280,23 +356,7 @@ class MainWindow(QMainWindow):
         take effect immediately without restarting the application.
         """
 
-        tools = load_tools_config()
-        specs: list[AppSpec] = []
-        for t in tools:
-            if not t.enabled:
-                continue
-            specs.append(
-                AppSpec(
-                    name=t.label,
-                    project_dir=BASE_DIR / t.project_dir,
-                    script=t.script,
-                    kind=t.kind,
-                    moonraker_url=getattr(t, "moonraker_url", None),
-                    moonraker_port=getattr(t, "moonraker_port", None),
-                )
-            )
-
-        self._build_runners(specs)
+        self._build_runners(build_app_specs(load_tools_config()))
 
     def _refresh_all_buttons(self) -> None:
         """Update Start all / Stop all button enabled state.
@@ -310,8 +370,16 @@ class MainWindow(QMainWindow):
         if not hasattr(self, "runners"):
             return
 
-        any_running = any(r.is_running() for r in self.runners)
-        any_stopped = any(not r.is_running() for r in self.runners)
+        # One pass over the runners (each is_running() asks its QProcess),
+        # stopping as soon as both states have been seen.
+        any_running = any_stopped = False
+        for r in self.runners:
+            if r.is_running():
+                any_running = True
+            else:
+                any_stopped = True
+            if any_running and any_stopped:
+                break
 
         self.btn_start_all.setEnabled(any_stopped)
         self.btn_stop_all.setEnabled(any_running)
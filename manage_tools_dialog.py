@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from functools import lru_cache
 from typing import List, Callable, Optional
 from pathlib import Path
-from urllib.parse import urlparse
-import json
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLabel,
     QLineEdit,
     QComboBox,
@@ -25,6 +31,166 @@ from config import load_tools_config, save_tools_config, ToolEntry
 from app_spec import BASE_DIR
 
 
+_MOONRAKER_URL_FMT = "http://{}:{}/printer/objects/query".format
+
+# (project_dir, script) pairs of helper tools that take an SSH password from
+# credentials.json rather than from the config.
+_CREDENTIALED_TOOLS = frozenset({("qidiwebcamdrestart", "webcamdrestart.py")})
+
+
+def _moonraker_targets(tools: List[ToolEntry]) -> dict[tuple[str, int], List[str]]:
+    """Map each enabled tool's Moonraker (host, port) to the tool labels using it."""
+
+    from urllib.parse import urlparse
+
+    targets: dict[tuple[str, int], List[str]] = {}
+    for t in tools:
+        if not t.enabled or not t.moonraker_url:
+            continue
+        try:
+            parsed = urlparse(t.moonraker_url)
+            host = parsed.hostname
+            port = parsed.port or t.moonraker_api_port or 7125
+        except ValueError:
+            continue
+        if host:
+            targets.setdefault((host, port), []).append(t.label)
+    return targets
+
+
+def _unreachable_moonrakers(
+    targets: dict[tuple[str, int], List[str]], timeout: float = 0.5
+) -> List[str]:
+    """Return a description of each Moonraker in ``targets`` that is down.
+
+    A wrong IP otherwise only shows up later as a dashboard that never loads.
+    All hosts are probed concurrently with a plain TCP connect, so the
+    whole check costs at most ``timeout`` seconds regardless of how many
+    printers are configured. This blocks, so run it off the GUI thread.
+    """
+
+    import asyncio
+
+    if not targets:
+        return []
+
+    async def probe(host: str, port: int) -> bool:
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+
+    async def probe_all() -> list[bool]:
+        return await asyncio.gather(*(probe(h, p) for h, p in targets))
+
+    # Not asyncio.run(): that waits for the default executor on shutdown, so
+    # a hung DNS lookup would block past the timeout.
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(probe_all())
+    finally:
+        loop.close()
+
+    return [
+        f"{', '.join(labels)} ({host}:{port})"
+        for ((host, port), labels), ok in zip(targets.items(), results)
+        if not ok
+    ]
+
+
+class _ProbeSignals(QObject):
+    finished = Signal(list)
+
+
+class _MoonrakerProbe(QRunnable):
+    """Runs _unreachable_moonrakers on a pool thread.
+
+    The result is emitted through ``signals.finished``, which Qt queues back
+    to the receiver's (GUI) thread.
+    """
+
+    def __init__(self, targets: dict[tuple[str, int], List[str]]) -> None:
+        super().__init__()
+        self.targets = targets
+        self.signals = _ProbeSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(_unreachable_moonrakers(self.targets))
+
+
+@lru_cache(maxsize=4)
+def _read_credentials(path_str: str, mtime_ns: int) -> dict:
+    """Parse a credentials.json file, cached per (path, modification time).
+
+    The password is reloaded every time the webcam restart tool is selected;
+    keying on mtime_ns means edits made outside the dialog are still picked
+    up. The returned dict is shared, so callers must not modify it.
+    """
+
+    import json
+
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+
+class ToolListModel(QAbstractListModel):
+    """List model over the dialog's ToolEntry list.
+
+    Rows show the tool label (DisplayRole) and carry its id (UserRole). Adds
+    and removes are reported as single-row inserts/removals, so the view only
+    touches the affected row instead of rebuilding every item.
+    """
+
+    def __init__(self, tools: List[ToolEntry], parent=None) -> None:
+        super().__init__(parent)
+        self.tools = tools
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.tools)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self.tools[index.row()]
+        if role == Qt.DisplayRole:
+            return t.label
+        if role == Qt.UserRole:
+            return t.id
+        return None
+
+    def append(self, tool: ToolEntry) -> None:
+        row = len(self.tools)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tools.append(tool)
+        self.endInsertRows()
+
+    def remove(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.tools[row]
+        self.endRemoveRows()
+
+    def set_tool(self, row: int, tool: ToolEntry) -> None:
+        """Replace the entry at ``row``, repainting only that row."""
+
+        old = self.tools[row]
+        self.tools[row] = tool
+        if tool.label != old.label or tool.id != old.id:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.UserRole])
+
+    def reset(self, tools: List[ToolEntry]) -> None:
+        self.beginResetModel()
+        self.tools = tools
+        self.endResetModel()
+
+
 class ManageToolsDialog(QDialog):
     """Dialog for adding/removing/editing launcher tools/printers.
 
@@ -45,12 +211,22 @@ class ManageToolsDialog(QDialog):
         self._dirty: bool = False
         self._current_row: int = -1
         self._on_saved_cb: Optional[Callable[[], None]] = on_saved
+        # Moonraker endpoints as last saved. Only endpoints added or changed
+        # since are probed on save, so a printer that is simply switched off
+        # does not warn on every save.
+        self._saved_targets = set(_moonraker_targets(self._tools))
 
         root = QHBoxLayout(self)
 
         # Left: list of tools
-        self.list = QListWidget()
-        self.list.currentRowChanged.connect(self._on_selection_changed)
+        self._model = ToolListModel(self._tools, self)
+        self.list = QListView()
+        # Every row is one line of text, so the view can lay out rows without
+        # measuring each one, and does so in batches.
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setModel(self._model)
+        self.list.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
         root.addWidget(self.list, 2)
 
         # Right: editor form
@@ -83,6 +259,11 @@ class ManageToolsDialog(QDialog):
             "Qidi Webcam restart."
         )
         self.chk_enabled = QCheckBox("Enabled")
+        self.chk_silent = QCheckBox("Write output to the log file only")
+        self.chk_silent.setToolTip(
+            "For chatty long-running tools: output goes straight to the log "
+            "file and the launcher log shows it with a short delay."
+        )
 
         # Optional password field, only meaningful for the Qidi webcam restart
         # helper. It writes to qidiwebcamdrestart/credentials.json which is
@@ -121,6 +302,7 @@ class ManageToolsDialog(QDialog):
         row("Kind", self.combo_kind)
         row("Webcam password", self.edit_password)
         form_col.addWidget(self.chk_enabled)
+        form_col.addWidget(self.chk_silent)
 
         form_col.addStretch(1)
 
@@ -147,7 +329,7 @@ class ManageToolsDialog(QDialog):
         root.addLayout(form_col, 3)
 
         # Mark the form dirty whenever the user edits any visible field
-        for w in (
+        line_edits = (
             self.edit_label,
             self.edit_project_dir,
             self.edit_script,
@@ -155,32 +337,60 @@ class ManageToolsDialog(QDialog):
             self.edit_moonraker_api_port,
             self.edit_moonraker_port,
             self.edit_password,
-        ):
+        )
+        for w in line_edits:
             w.textEdited.connect(self._mark_dirty)
         self.combo_kind.currentIndexChanged.connect(self._mark_dirty)
         self.chk_enabled.toggled.connect(self._mark_dirty)
+        self.chk_silent.toggled.connect(self._mark_dirty)
+        self._form_widgets = (
+            *line_edits, self.combo_kind, self.chk_enabled, self.chk_silent
+        )
 
         self._refresh_list()
 
     # ---- Internal helpers ----
 
     def _refresh_list(self) -> None:
-        self.list.clear()
-        for t in self._tools:
-            item = QListWidgetItem(t.label)
-            item.setData(Qt.UserRole, t.id)
-            self.list.addItem(item)
+        # Keep the reset itself quiet and load the form once, explicitly,
+        # for the row that ends up selected (or clear it if none is left).
+        sel = self.list.selectionModel()
+        sel.blockSignals(True)
+        try:
+            self._model.reset(self._tools)
+        finally:
+            sel.blockSignals(False)
+        self._select_row(0 if self._tools else -1)
+
+    def _select_row(self, row: int, notify: bool = True) -> None:
+        """Make ``row`` current, then (if ``notify``) load it into the form.
+
+        The selection model's signals are blocked while moving so that the
+        form is loaded exactly once, even when the view had already moved
+        the current row itself (e.g. after a removal).
+        """
+
+        sel = self.list.selectionModel()
+        index = self._model.index(row, 0) if row >= 0 else QModelIndex()
+        sel.blockSignals(True)
+        try:
+            self.list.setCurrentIndex(index)
+        finally:
+            sel.blockSignals(False)
+        if index.isValid():
+            self.list.scrollTo(index)
+        self.list.viewport().update()
 
-        if self._tools:
-            self.list.setCurrentRow(0)
-            self._current_row = 0
-        else:
-            self._current_row = -1
+        if notify:
+            self._on_selection_changed(row)
 
     def _current_index(self) -> int:
-        row = self.list.currentRow()
+        row = self.list.currentIndex().row()
         return row if 0 <= row < len(self._tools) else -1
 
+    def _on_current_row_changed(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        self._on_selection_changed(current.row())
+
     def _on_selection_changed(self, row: int) -> None:
         # If there are unsaved edits for the previously selected entry, offer
         # to keep or discard them before switching.
@@ -195,30 +405,41 @@ class ManageToolsDialog(QDialog):
 
             if choice == QMessageBox.Cancel:
                 # Revert the selection change
-                self.list.blockSignals(True)
-                self.list.setCurrentRow(self._current_row)
-                self.list.blockSignals(False)
+                self._select_row(self._current_row, notify=False)
                 return
 
             if choice == QMessageBox.Yes:
                 updated = self._validate_from_form(self._tools[self._current_row])
                 if updated is None:
                     # Validation failed; stay on current row
-                    self.list.blockSignals(True)
-                    self.list.setCurrentRow(self._current_row)
-                    self.list.blockSignals(False)
+                    self._select_row(self._current_row, notify=False)
                     return
-                self._tools[self._current_row] = updated
+                self._model.set_tool(self._current_row, updated)
 
             # Either kept or discarded; form is now considered clean
             self._dirty = False
 
         self._current_row = row
 
-        if row < 0 or row >= len(self._tools):
-            self._clear_form()
-            return
-        t = self._tools[row]
+        tool = self._tools[row] if 0 <= row < len(self._tools) else None
+        self._populate_form(tool)
+        self._dirty = False
+
+    def _populate_form(self, t: ToolEntry | None) -> None:
+        # Programmatic updates must not look like user edits, so silence the
+        # form widgets while loading them.
+        for w in self._form_widgets:
+            w.blockSignals(True)
+        try:
+            if t is None:
+                self._clear_form()
+            else:
+                self._fill_form(t)
+        finally:
+            for w in self._form_widgets:
+                w.blockSignals(False)
+
+    def _fill_form(self, t: ToolEntry) -> None:
         self.edit_label.setText(t.label)
         self.edit_project_dir.setText(t.project_dir)
         self.edit_script.setText(t.script)
@@ -228,6 +449,8 @@ class ManageToolsDialog(QDialog):
         # handled behind the scenes.
         host_text = ""
         if t.moonraker_url:
+            from urllib.parse import urlparse
+
             try:
                 parsed = urlparse(t.moonraker_url)
                 host_text = parsed.hostname or t.moonraker_url
@@ -235,8 +458,8 @@ class ManageToolsDialog(QDialog):
                 host_text = t.moonraker_url
         self.edit_moonraker_url.setText(host_text)
 
-        # API port: use stored value or default to 7125 if not set.
-        api_port_val = getattr(t, "moonraker_api_port", None) or 7125
+        # API port: use stored value or default to 7125 if it is 0.
+        api_port_val = t.moonraker_api_port or 7125
         self.edit_moonraker_api_port.setText(str(api_port_val))
 
         # Dashboard (Flask) port is optional.
@@ -246,12 +469,12 @@ class ManageToolsDialog(QDialog):
         idx = self.combo_kind.findText(t.kind)
         self.combo_kind.setCurrentIndex(idx if idx >= 0 else 0)
         self.chk_enabled.setChecked(t.enabled)
+        self.chk_silent.setChecked(t.silent)
 
         if self._is_qidi_webcam_tool(t):
             self._load_webcam_password()
         else:
             self.edit_password.clear()
-        self._dirty = False
 
     def _clear_form(self) -> None:
         self.edit_label.clear()
@@ -263,27 +486,43 @@ class ManageToolsDialog(QDialog):
         self.edit_password.clear()
         self.combo_kind.setCurrentIndex(0)
         self.chk_enabled.setChecked(True)
+        self.chk_silent.setChecked(False)
 
     def _on_add(self) -> None:
+        # Counting from the list length can land on an id still in use after
+        # removals, so step past any that are taken.
+        used = {t.id for t in self._tools}
+        n = len(self._tools) + 1
+        while f"printer-{n}" in used:
+            n += 1
         new = ToolEntry(
-            id=f"printer-{len(self._tools)+1}",
+            id=f"printer-{n}",
             label="New printer",
             project_dir="VoronTemps",
             script="app.py",
             kind="normal",
             enabled=True,
         )
-        self._tools.append(new)
-        self._refresh_list()
-        self.list.setCurrentRow(len(self._tools) - 1)
+        self._model.append(new)
+        self._select_row(len(self._tools) - 1)
         self._dirty = True
 
     def _on_remove(self) -> None:
         idx = self._current_index()
         if idx < 0:
             return
-        del self._tools[idx]
-        self._refresh_list()
+        # The removed entry's unsaved form edits go with it, so don't offer
+        # to keep them when the selection moves on.
+        self._current_row = -1
+        self._dirty = False
+        sel = self.list.selectionModel()
+        sel.blockSignals(True)
+        try:
+            self._model.remove(idx)
+        finally:
+            sel.blockSignals(False)
+        # Select the entry that moved into the removed row (or the new last).
+        self._select_row(min(idx, len(self._tools) - 1))
         self._dirty = True
 
     def _on_save(self) -> None:
@@ -293,7 +532,7 @@ class ManageToolsDialog(QDialog):
             updated = self._validate_from_form(self._tools[idx])
             if updated is None:
                 return
-            self._tools[idx] = updated
+            self._model.set_tool(idx, updated)
 
         # Also validate all entries to avoid saving obviously broken config
         cleaned: List[ToolEntry] = []
@@ -311,9 +550,11 @@ class ManageToolsDialog(QDialog):
         self._maybe_save_webcam_password()
 
         save_tools_config(cleaned)
-        self._tools = cleaned
-        self._refresh_list()
         self._dirty = False
+        if idx >= 0:
+            # The edited row was already patched in place; just reload the
+            # form so it shows the values as saved.
+            self._on_selection_changed(idx)
 
         # Notify caller (e.g. MainWindow) so it can live-refresh its tool list.
         if self._on_saved_cb is not None:
@@ -323,12 +564,29 @@ class ManageToolsDialog(QDialog):
                 # Do not let callback failures break the dialog UX.
                 pass
 
+        targets = _moonraker_targets(cleaned)
+        changed = {k: v for k, v in targets.items() if k not in self._saved_targets}
+        self._saved_targets = set(targets)
+        if changed:
+            probe = _MoonrakerProbe(changed)
+            probe.signals.finished.connect(self._on_probe_finished)
+            QThreadPool.globalInstance().start(probe)
+
         QMessageBox.information(
             self,
             "Configuration saved",
             "Tools configuration has been saved.",
         )
 
+    def _on_probe_finished(self, unreachable: List[str]) -> None:
+        if not unreachable or not self.isVisible():
+            return
+        QMessageBox.warning(
+            self,
+            "Moonraker not responding",
+            "These Moonraker hosts did not respond:\n\n" + "\n".join(unreachable),
+        )
+
     def _validate_from_form(self, original: ToolEntry) -> ToolEntry | None:
         label = self.edit_label.text().strip()
         project_dir = self.edit_project_dir.text().strip()
@@ -349,6 +607,7 @@ class ManageToolsDialog(QDialog):
             moonraker_port = None
         kind = self.combo_kind.currentText().strip() or "normal"
         enabled = self.chk_enabled.isChecked()
+        silent = self.chk_silent.isChecked()
 
         if not label or not project_dir or not script:
             QMessageBox.warning(
@@ -364,7 +623,7 @@ class ManageToolsDialog(QDialog):
         moonraker_url: str | None
         if host:
             api_port = moonraker_api_port or 7125
-            moonraker_url = f"http://{host}:{api_port}/printer/objects/query"
+            moonraker_url = _MOONRAKER_URL_FMT(host, api_port)
         else:
             moonraker_url = None
 
@@ -378,6 +637,7 @@ class ManageToolsDialog(QDialog):
             moonraker_port=moonraker_port,
             kind=kind,
             enabled=enabled,
+            silent=silent,
         )
 
     def _mark_dirty(self) -> None:
@@ -412,22 +672,26 @@ class ManageToolsDialog(QDialog):
         return BASE_DIR / "qidiwebcamdrestart" / "credentials.json"
 
     def _is_qidi_webcam_tool(self, t: ToolEntry) -> bool:
-        return t.project_dir == "qidiwebcamdrestart" and t.script == "webcamdrestart.py"
+        return (t.project_dir, t.script) in _CREDENTIALED_TOOLS
 
     def _load_webcam_password(self) -> None:
         path = self._credentials_path()
         try:
-            raw = path.read_text(encoding="utf-8")
-            data = json.loads(raw)
-            pw = data.get("password")
-            if isinstance(pw, str):
-                self.edit_password.setText(pw)
-            else:
-                self.edit_password.clear()
-        except FileNotFoundError:
+            st = path.stat()
+        except OSError:
+            # No credentials saved yet (the usual case on a fresh install).
             self.edit_password.clear()
+            return
+
+        try:
+            data = _read_credentials(str(path), st.st_mtime_ns)
+            pw = data.get("password")
         except Exception:
             # On parse errors, just clear the field rather than raising.
+            pw = None
+        if isinstance(pw, str):
+            self.edit_password.setText(pw)
+        else:
             self.edit_password.clear()
 
     def _maybe_save_webcam_password(self) -> None:
@@ -448,10 +712,15 @@ class ManageToolsDialog(QDialog):
                 path.unlink()
             except FileNotFoundError:
                 pass
+            _read_credentials.cache_clear()
             return
 
+        import json
+
         path.parent.mkdir(parents=True, exist_ok=True)
         payload = {"password": pw}
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        # The rewrite may land within the filesystem's mtime granularity.
+        _read_credentials.cache_clear()
 
 
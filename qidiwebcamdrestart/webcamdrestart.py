@@ -1,9 +1,7 @@
 import json
 import os
-from pathlib import Path
-
-import paramiko
 import time
+from pathlib import Path
 
 
 def _load_password() -> str:
@@ -48,44 +46,87 @@ def _load_password() -> str:
     return pw
 
 
+# User settings
+IP_ADDRESS = "192.168.1.120"
+USERNAME = "root"
+
+# Command to execute
+COMMAND = "sudo service webcamd restart"
+
+# Seconds to wait for the command's output, and then for its exit status.
+COMMAND_TIMEOUT = 15
+
+# paramiko, once imported by _new_ssh_client.
+_paramiko = None
+
+
+def _new_ssh_client():
+    """Create an SSH client, importing paramiko on first use.
+
+    paramiko pulls in cryptography and friends, so it is only loaded when an
+    SSH session is actually needed rather than whenever this module loads.
+    """
+
+    global _paramiko
+    if _paramiko is None:
+        import paramiko
+
+        _paramiko = paramiko
+
+    client = _paramiko.SSHClient()
+    client.set_missing_host_key_policy(_paramiko.AutoAddPolicy())
+    return client
+
+
 def ssh_command(ip, username, password, command):
     # Create a new SSH client
-    client = paramiko.SSHClient()
-    # Automatically add host keys from the system host keys
-    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-    
+    client = _new_ssh_client()
+
     try:
         # Connect to the SSH server
         client.connect(ip, username=username, password=password)
-        # Start an interactive shell session
-        ssh_session = client.invoke_shell()
-        
-        # Wait for the prompt
-        time.sleep(1)
-        
-        # Send the command
-        ssh_session.send(command + "\n")
-        time.sleep(1)  # Wait for the command to execute
-        
-        # Send the exit command
-        ssh_session.send("exit\n")
-        time.sleep(0.5)
-        
-        # Receive the output
-        output = ssh_session.recv(5000).decode()
-        print(output)
-        
+        # Run the command directly; this returns as soon as it has finished
+        # rather than waiting on fixed delays for an interactive shell.
+        _stdin, stdout, stderr = client.exec_command(command, timeout=COMMAND_TIMEOUT)
+        channel = stdout.channel
+
+        # Drain the output first: a command blocked on a full channel never
+        # exits. Each read gives up after COMMAND_TIMEOUT seconds of silence.
+        try:
+            out = stdout.read().decode(errors="replace")
+            err = stderr.read().decode(errors="replace")
+        except TimeoutError as exc:
+            raise RuntimeError(
+                f"Timed out after {COMMAND_TIMEOUT}s waiting for output from {command!r} on {ip}"
+            ) from exc
+
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        while not channel.exit_status_ready():
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"Timed out after {COMMAND_TIMEOUT}s waiting for {command!r} to exit on {ip}"
+                )
+            time.sleep(0.1)
+        exit_status = channel.recv_exit_status()
+
+        if out:
+            print(out, end="")
+        if err:
+            print(err, end="")
+        print(f"Exit status: {exit_status}")
+
     finally:
         # Close the connection
         client.close()
 
-# User settings
-ip_address = "192.168.1.120"
-username = "root"
-password = _load_password()
 
-# Commands to execute
-commands = "sudo service webcamd restart"
+def ssh_restart_webcamd(
+    ip: str = IP_ADDRESS, username: str = USERNAME, command: str = COMMAND
+) -> None:
+    """Restart the webcamd service on the printer over SSH."""
+
+    ssh_command(ip, username, _load_password(), command)
+
 
-# Run the SSH command function
-ssh_command(ip_address, username, password, commands)
+if __name__ == "__main__":
+    ssh_restart_webcamd()
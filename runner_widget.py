@@ -1,11 +1,16 @@
 # runner_widget.py
 from __future__ import annotations
 
+import atexit
+import codecs
+import os
+import threading
 import time
 import re
+from queue import SimpleQueue
 from typing import Callable
 
-from PySide6.QtCore import Qt, QProcess, QTimer
+from PySide6.QtCore import Qt, QIODevice, QProcess, QProcessEnvironment, QTimer
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox
@@ -14,8 +19,126 @@ from PySide6.QtWidgets import (
 from app_spec import AppSpec
 
 
-# Strip ANSI colour / control codes (e.g. from Flask, paramiko, remote shells)
-ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+# Strip ANSI colour / control codes (e.g. from Flask, paramiko, remote shells).
+# Applied to the raw output bytes, before decoding; the pattern is pure ASCII
+# so it cannot match inside a multi-byte UTF-8 sequence.
+ANSI_ESCAPE_RE = re.compile(rb"\x1B\[[0-?]*[ -/]*[@-~]")
+
+# Log file output is buffered and written at most this often, or as soon as
+# this much is pending, instead of reopening the file for every chunk.
+_LOG_FLUSH_MS = 50
+_LOG_FLUSH_BYTES = 64 * 1024
+
+# At most this much child output (in characters) is passed to the GUI log per
+# window; the rest of a runaway burst only goes to the log file.
+_GUI_WINDOW_MS = 100
+_GUI_WINDOW_CHARS = 256 * 1024
+
+# How often the log file of a "silent" tool is polled for new output.
+_TAIL_MS = 250
+
+# Flags for the raw append-only log descriptor. O_BINARY only exists (and is
+# only needed, to stop newline translation) on Windows.
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+class _LogWriter:
+    """Appends runner output to log files from a background thread.
+
+    Runners hand over filled buffers and carry on, so a slow disk never
+    stalls the GUI. One descriptor is kept per file until its runner asks
+    for it to be closed.
+    """
+
+    def __init__(self) -> None:
+        # Items: (path, bytes) to append, (path, None) to close, an Event to
+        # set once everything before it is written, or None to stop.
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def write(self, path: str, data: bytearray) -> None:
+        self._ensure_started()
+        self._queue.put((path, data))
+
+    def close(self, path: str) -> None:
+        self._queue.put((path, None))
+
+    def sync(self, timeout: float = 1.0) -> None:
+        """Wait (briefly) until everything queued so far is on disk."""
+
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def shutdown(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(2.0)
+
+    def _ensure_started(self) -> None:
+        # Only ever called from the GUI thread, so no lock is needed.
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="launcher-log-writer", daemon=True
+            )
+            self._thread.start()
+            # Let pending output reach disk when the launcher exits.
+            atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        fds: dict[str, int] = {}
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+
+            path, data = item
+            if data is None:
+                self._close(fds, path)
+                continue
+            try:
+                self._append(fds, path, data)
+            except OSError:
+                # The descriptor may have gone stale (e.g. the log was
+                # rotated or removed underneath us), so reopen once and retry.
+                self._close(fds, path)
+                try:
+                    self._append(fds, path, data)
+                except OSError:
+                    pass
+
+        for path in list(fds):
+            self._close(fds, path)
+
+    @staticmethod
+    def _append(fds: dict[str, int], path: str, data: bytearray) -> None:
+        fd = fds.get(path)
+        if fd is None:
+            # A raw descriptor rather than open(): writes are already
+            # batched, so io's buffered writer would only add another copy.
+            fd = fds[path] = os.open(path, _LOG_OPEN_FLAGS, 0o644)
+        with memoryview(data) as view:
+            # os.write may write less than asked for; carry on from there.
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+
+    @staticmethod
+    def _close(fds: dict[str, int], path: str) -> None:
+        fd = fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+_LOG_WRITER = _LogWriter()
 
 
 class AppRunner(QWidget):
@@ -33,6 +156,47 @@ class AppRunner(QWidget):
         self.proc.finished.connect(self._on_finished)
         self.proc.errorOccurred.connect(self._on_error)
 
+        # Output arrives in arbitrary chunks, so a multi-byte character can be
+        # split across two reads; the incremental decoder carries it over.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        # Set while a _drain is queued for the next event-loop pass.
+        self._drain_pending = False
+
+        self._log_buf = bytearray()
+        # Log file the writer currently holds open for this runner, if any.
+        self._log_target: str | None = None
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Child output forwarded to the GUI in the current window, and how
+        # much was held back from it.
+        self._gui_sent = 0
+        self._gui_omitted = 0
+        self._gui_timer = QTimer(self)
+        self._gui_timer.setSingleShot(True)
+        self._gui_timer.setInterval(_GUI_WINDOW_MS)
+        self._gui_timer.timeout.connect(self._end_gui_window)
+
+        # Silent tools write straight to the log file; while one runs, the
+        # GUI follows that file from _tail_pos instead of reading the pipe.
+        self._tailing = False
+        self._tail_pos = 0
+        self._tail_timer = QTimer(self)
+        self._tail_timer.setInterval(_TAIL_MS)
+        self._tail_timer.timeout.connect(self._read_tail)
+
+        # Badge kind last applied by _set_status; re-polishing is only needed
+        # when it changes.
+        self._status_kind: str | None = None
+
+        # Set when the spec changes mid-run: the cached paths and environment
+        # still describe the active run and are rebuilt on the next start.
+        self._paths_stale = False
+        self._cache_paths()
+        self._env = self._build_env()
         self._build_ui()
         self._set_status("Stopped", kind="stopped")
         self._refresh_buttons()
@@ -47,9 +211,9 @@ class AppRunner(QWidget):
         header = QHBoxLayout()
         header.setSpacing(10)
 
-        title = QLabel(self.spec.name)
-        title.setObjectName("CardTitle")
-        title.setWordWrap(True)
+        self.title = QLabel(self.spec.name)
+        self.title.setObjectName("CardTitle")
+        self.title.setWordWrap(True)
 
         self.status = QLabel("")
         self.status.setObjectName("StatusBadge")
@@ -57,7 +221,7 @@ class AppRunner(QWidget):
         self.status.setFixedHeight(24)
         self.status.setMinimumWidth(90)
 
-        header.addWidget(title, 1)
+        header.addWidget(self.title, 1)
         header.addWidget(self.status, 0)
 
         btns = QHBoxLayout()
@@ -71,12 +235,7 @@ class AppRunner(QWidget):
         self.btn_start.setObjectName("StartButton")
         self.btn_stop.setObjectName("StopButton")
 
-        # Special-case UI for one-shot tools (e.g. webcam restart): show a
-        # single primary action button and hide Stop. This is driven by the
-        # spec.kind field so users can rename tools without breaking behaviour.
-        if getattr(self.spec, "kind", "normal") == "oneshot":
-            self.btn_start.setText("Run")
-            self.btn_stop.hide()
+        self._apply_kind()
 
         self.btn_start.clicked.connect(self.start)
         self.btn_stop.clicked.connect(self.stop)
@@ -95,6 +254,82 @@ class AppRunner(QWidget):
         # extra meta label here to keep the UI clean.
         outer.addLayout(btns)
 
+    def _apply_kind(self) -> None:
+        # Special-case UI for one-shot tools (e.g. webcam restart): show a
+        # single primary action button and hide Stop. This is driven by the
+        # spec.kind field so users can rename tools without breaking behaviour.
+        oneshot = getattr(self.spec, "kind", "normal") == "oneshot"
+        self.btn_start.setText("Run" if oneshot else "Start")
+        self.btn_stop.setVisible(not oneshot)
+
+    def update_spec(self, spec: AppSpec) -> None:
+        """Switch this card to an edited spec without recreating it.
+
+        A running process is left alone; if its launch settings changed they
+        take effect the next time it is started.
+        """
+
+        if spec == self.spec:
+            return
+
+        old = self.spec
+        self.spec = spec
+        if self.is_running():
+            # The log writer, tail and Open buttons keep using the running
+            # process's paths until it exits.
+            self._paths_stale = True
+        else:
+            self._refresh_launch_state()
+        self.title.setText(spec.name)
+        if spec.kind != old.kind:
+            self._apply_kind()
+
+        launch_changed = (
+            spec.name != old.name
+            or spec.project_dir != old.project_dir
+            or spec.script != old.script
+            or spec.moonraker_url != old.moonraker_url
+            or spec.moonraker_port != old.moonraker_port
+            or spec.silent != old.silent
+        )
+        if launch_changed and self.is_running():
+            self._log("[launcher] Settings changed; restart to apply them.\n")
+
+    def _refresh_launch_state(self) -> None:
+        self._cache_paths()
+        self._env = self._build_env()
+        self._paths_stale = False
+
+    def _cache_paths(self) -> None:
+        # String forms of the spec's fixed paths, used on every start and by
+        # the Open buttons. The venv interpreter is deliberately not cached:
+        # spec.venv_python probes the disk, and the venv may appear later.
+        spec = self.spec
+        self._project_dir_str = str(spec.project_dir)
+        self._script_path_str = str(spec.script_path)
+        self._log_path_str = str(spec.log_path)
+        self._log_uri = spec.log_path.as_uri()
+        self._folder_uri = spec.project_dir.as_uri()
+
+    def _build_env(self) -> QProcessEnvironment:
+        # Built once per spec rather than on every start, starting from the
+        # launcher's own environment so the child still gets PATH, SYSTEMROOT
+        # and friends.
+        #
+        # ✅ Force UTF-8 for child process stdout/stderr on Windows and inject
+        # optional Moonraker URL for Klipper printers. Also pass the launcher
+        # label so dashboards can show which printer they belong to.
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert("PYTHONUTF8", "1")
+        env.insert("PYTHONIOENCODING", "utf-8")
+        # Used by dashboard apps (e.g. VoronTemps, Qidi temps) to display a
+        # human‑friendly printer name in the HTML.
+        env.insert("LAUNCHER_TOOL_LABEL", self.spec.name)
+        url = self.spec.moonraker_url
+        if url:
+            env.insert("MOONRAKER_API_URL", url)
+        return env
+
     def validate(self) -> tuple[bool, str]:
         if not self.spec.project_dir.exists():
             return False, f"Project dir not found:\n{self.spec.project_dir}"
@@ -111,6 +346,9 @@ class AppRunner(QWidget):
         if self.is_running():
             return
 
+        if self._paths_stale:
+            self._refresh_launch_state()
+
         ok, msg = self.validate()
         if not ok:
             self._set_status("Error", kind="error")
@@ -119,40 +357,49 @@ class AppRunner(QWidget):
             self._refresh_buttons()
             return
 
-        self.proc.setWorkingDirectory(str(self.spec.project_dir))
-        self.proc.setProgram(str(self.spec.venv_python))
+        # The log's folder is created here, once per start, not on every
+        # write.
+        try:
+            self.spec.log_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
 
-        args = [str(self.spec.script_path)]
+        port = self.spec.moonraker_port
+        url = self.spec.moonraker_url
+        silent = self.spec.silent
+
+        # Silent tools have Qt append their output (stderr is merged into
+        # it) to the log file directly; an empty name restores the pipe.
+        self.proc.setStandardOutputFile(
+            self._log_path_str if silent else "", QIODevice.Append
+        )
+
+        venv_python = str(self.spec.venv_python)
+        self.proc.setWorkingDirectory(self._project_dir_str)
+        self.proc.setProgram(venv_python)
+
+        args = [self._script_path_str]
         # Optional per-printer Moonraker port (for Klipper dashboards). When
         # specified, append a --port argument so multiple dashboards can run
         # concurrently on different ports.
-        if getattr(self.spec, "moonraker_port", None):
-            args.extend(["--port", str(self.spec.moonraker_port)])
+        if port:
+            args.extend(["--port", str(port)])
         self.proc.setArguments(args)
 
-        # ✅ Force UTF-8 for child process stdout/stderr on Windows and inject
-        # optional Moonraker URL for Klipper printers. Also pass the launcher
-        # label so dashboards can show which printer they belong to.
-        env = self.proc.processEnvironment()
-        env.insert("PYTHONUTF8", "1")
-        env.insert("PYTHONIOENCODING", "utf-8")
-        # Used by dashboard apps (e.g. VoronTemps, Qidi temps) to display a
-        # human‑friendly printer name in the HTML.
-        env.insert("LAUNCHER_TOOL_LABEL", self.spec.name)
-        url = getattr(self.spec, "moonraker_url", None)
-        if url:
-            env.insert("MOONRAKER_API_URL", url)
-        self.proc.setProcessEnvironment(env)
+        self.proc.setProcessEnvironment(self._env)
 
         self._log(f"\n==== {time.strftime('%Y-%m-%d %H:%M:%S')} START ====\n")
-        self._log(f"[launcher] Using: {self.spec.venv_python}\n")
-        self._log(f"[launcher] Working dir: {self.spec.project_dir}\n")
-        self._log(f"[launcher] Script: {self.spec.script_path}\n")
-        if getattr(self.spec, "moonraker_url", None):
-            self._log(f"[launcher] Moonraker URL: {self.spec.moonraker_url}\n")
-        if getattr(self.spec, "moonraker_port", None):
-            self._log(f"[launcher] Dashboard port: {self.spec.moonraker_port}\n")
+        self._log(f"[launcher] Using: {venv_python}\n")
+        self._log(f"[launcher] Working dir: {self._project_dir_str}\n")
+        self._log(f"[launcher] Script: {self._script_path_str}\n")
+        if url:
+            self._log(f"[launcher] Moonraker URL: {url}\n")
+        if port:
+            self._log(f"[launcher] Dashboard port: {port}\n")
 
+        self._decoder.reset()
+        if silent:
+            self._start_tail()
         self._set_status("Starting…", kind="warn")
         self.proc.start()
         self._refresh_buttons()
@@ -180,24 +427,148 @@ class AppRunner(QWidget):
             self._log("[launcher] Force-killing process.\n")
             self.proc.kill()
 
-    def _log(self, text: str) -> None:
-        # Normalise text by removing terminal colour codes so logs stay readable
-        # in the GUI and on disk.
-        if text:
-            text = ANSI_ESCAPE_RE.sub("", text)
+    def _log(self, text: str, gui_text: str | None = None) -> None:
+        """Append ``text`` to the log file and show it in the GUI log.
 
-        try:
-            self.spec.project_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.spec.log_path, "a", encoding="utf-8", errors="replace") as f:
-                f.write(text)
-        except Exception:
+        ``gui_text`` replaces what the GUI is given (nothing if empty).
+        """
+
+        self._log_buf += text.encode("utf-8", errors="replace")
+        if self._tailing:
+            # A silent tool owns the log file while it runs; our own lines
+            # are held until it exits so they cannot land mid-line (or
+            # mid-character) in its output.
             pass
-        self.log_sink(self.spec.name, text)
+        elif len(self._log_buf) >= _LOG_FLUSH_BYTES:
+            self._flush_log()
+        elif not self._log_timer.isActive():
+            self._log_timer.start()
+        if gui_text is None:
+            gui_text = text
+        if gui_text:
+            self.log_sink(self.spec.name, gui_text)
+
+    def _gui_share(self, text: str) -> str:
+        """Return the part of ``text`` that fits in this window's GUI budget."""
+
+        if not self._gui_timer.isActive():
+            self._gui_timer.start()
+        room = _GUI_WINDOW_CHARS - self._gui_sent
+        if len(text) <= room:
+            self._gui_sent += len(text)
+            return text
+        room = max(room, 0)
+        self._gui_sent += room
+        self._gui_omitted += len(text) - room
+        return text[:room]
+
+    def _end_gui_window(self) -> None:
+        self._gui_timer.stop()
+        self._gui_sent = 0
+        if self._gui_omitted:
+            self.log_sink(
+                self.spec.name,
+                f"\n[launcher] … {self._gui_omitted} characters of output not "
+                "shown here; see the log file.\n",
+            )
+            self._gui_omitted = 0
+
+    def _flush_log(self) -> None:
+        """Hand any buffered log output to the background writer.
+
+        The writer keeps the file open while the process runs; it is closed
+        again once it has stopped, so the log can be moved or deleted between
+        runs.
+        """
+
+        self._log_timer.stop()
+        if self._log_buf and not self._tailing:
+            if self._log_target is None:
+                self._log_target = self._log_path_str
+            # The writer takes ownership of the buffer; start a fresh one.
+            _LOG_WRITER.write(self._log_target, self._log_buf)
+            self._log_buf = bytearray()
+
+        if self._log_target is not None and not self.is_running():
+            _LOG_WRITER.close(self._log_target)
+            self._log_target = None
+
+    def _start_tail(self) -> None:
+        # Everything logged so far has already been shown, so write it out
+        # and follow the file from its end.
+        self._flush_log()
+        _LOG_WRITER.sync()
+        try:
+            self._tail_pos = os.stat(self._log_path_str).st_size
+        except OSError:
+            self._tail_pos = 0
+        self._tailing = True
+        self._tail_timer.start()
+
+    def _read_tail(self) -> None:
+        try:
+            with open(self._log_path_str, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < self._tail_pos:
+                    # The log was truncated or replaced mid-run: follow the
+                    # new file from its start (capped to the window below).
+                    self._tail_pos = 0
+                    self._decoder.reset()
+                pending = size - self._tail_pos
+                if pending <= 0:
+                    return
+                if pending > _GUI_WINDOW_CHARS:
+                    # Runaway output: only the newest part is worth showing.
+                    self._gui_omitted += pending - _GUI_WINDOW_CHARS
+                    self._tail_pos = size - _GUI_WINDOW_CHARS
+                    if not self._gui_timer.isActive():
+                        self._gui_timer.start()
+                f.seek(self._tail_pos)
+                data = f.read(size - self._tail_pos)
+        except OSError:
+            return
+        self._tail_pos += len(data)
+
+        if b"\x1b" in data:
+            data = ANSI_ESCAPE_RE.sub(b"", data)
+        text = self._decoder.decode(data)
+        if text:
+            shown = self._gui_share(text)
+            if shown:
+                self.log_sink(self.spec.name, shown)
+
+    def _stop_tail(self) -> None:
+        if not self._tailing:
+            return
+        # Show the last of the tool's output, then let the held launcher
+        # lines through to the file again.
+        self._read_tail()
+        self._tail_timer.stop()
+        self._tailing = False
 
     def _on_ready_read(self) -> None:
-        data = bytes(self.proc.readAllStandardOutput())
-        if data:
-            self._log(data.decode("utf-8", errors="replace"))
+        # A chatty child can signal readyRead many times per event-loop pass;
+        # read it all in one go instead of once per signal.
+        if not self._drain_pending:
+            self._drain_pending = True
+            QTimer.singleShot(0, self._drain)
+
+    def _drain(self) -> None:
+        self._drain_pending = False
+        ba = self.proc.readAllStandardOutput()
+        if ba.isEmpty():
+            return
+        # Work on a view of Qt's buffer; ba.data() or bytes(ba) would copy it.
+        with memoryview(ba) as view:
+            # Normalise output by removing terminal colour codes so logs stay
+            # readable in the GUI and on disk. Most chunks contain no ESC
+            # byte at all, and Qt's search is far cheaper than a regex scan.
+            if ba.contains(b"\x1b"):
+                text = self._decoder.decode(ANSI_ESCAPE_RE.sub(b"", view))
+            else:
+                text = self._decoder.decode(view)
+        if text:
+            self._log(text, self._gui_share(text))
 
     def _on_started(self) -> None:
         self._set_status("Running", kind="ok")
@@ -210,17 +581,39 @@ class AppRunner(QWidget):
         self._refresh_buttons()
 
     def _on_finished(self, exit_code: int, _exit_status) -> None:
+        if self._tailing:
+            self._stop_tail()
+        else:
+            # Log output that is still waiting for a queued drain before EXIT.
+            self._drain()
+        # Emit anything the decoder was holding back (e.g. a truncated
+        # character at the very end of the output).
+        tail = self._decoder.decode(b"", final=True)
+        if tail:
+            self._log(tail, self._gui_share(tail))
+        self._end_gui_window()
         self._log(f"\n==== {time.strftime('%Y-%m-%d %H:%M:%S')} EXIT code={exit_code} ====\n")
+        self._flush_log()
+        if self._paths_stale:
+            # The run is over; point the Open buttons at the edited spec.
+            self._refresh_launch_state()
         self._set_status("Stopped", kind="stopped")
         self._refresh_buttons()
 
     def _on_error(self, err) -> None:
+        if not self.is_running():
+            # e.g. FailedToStart, after which finished is never emitted.
+            self._stop_tail()
         self._log(f"\n[launcher] QProcess error: {err}\n")
+        self._flush_log()
         self._set_status("Error", kind="error")
         self._refresh_buttons()
 
     def _set_status(self, text: str, kind: str) -> None:
         self.status.setText(text)
+        if kind == self._status_kind:
+            return
+        self._status_kind = kind
         self.status.setProperty("kind", kind)
         self.status.style().unpolish(self.status)
         self.status.style().polish(self.status)
@@ -231,11 +624,15 @@ class AppRunner(QWidget):
         self.btn_stop.setEnabled(running)
 
     def open_log(self) -> None:
+        self._flush_log()
+        _LOG_WRITER.sync()
         try:
-            self.spec.log_path.touch(exist_ok=True)
+            # Create the file _log_uri points at, which is the active run's
+            # log until it exits even if the spec was edited meanwhile.
+            open(self._log_path_str, "ab").close()
         except Exception:
             pass
-        QDesktopServices.openUrl(self.spec.log_path.as_uri())
+        QDesktopServices.openUrl(self._log_uri)
 
     def open_folder(self) -> None:
-        QDesktopServices.openUrl(self.spec.project_dir.as_uri())
+        QDesktopServices.openUrl(self._folder_uri)
@@ -1,6 +1,8 @@
 # styles.py
 from __future__ import annotations
 
+from functools import lru_cache
+
 THEMES = {
     "dark": {
         "bg": "#0B0E14",
@@ -47,81 +49,74 @@ THEMES = {
 }
 
 
-def build_styles(theme: str = "dark") -> str:
-    t = THEMES.get(theme, THEMES["dark"])
-
-    return f"""
+# Stylesheet text with %(key)s placeholders for the THEMES colours, filled in
+# with a single %-format from the theme dict (a literal percent sign must be
+# written as %%).
+_QSS_TEMPLATE = """
     /* Base */
-    QMainWindow {{ background: {t["bg"]}; }}
-    QWidget#Root {{ background: {t["bg"]}; }}
+    QMainWindow { background: %(bg)s; }
+    QWidget#Root { background: %(bg)s; }
 
     /* Dialogs (e.g. Manage printers/tools) */
-    QDialog {{
-        background: {t["panel"]};
-        color: {t["text"]};
-    }}
+    QDialog {
+        background: %(panel)s;
+        color: %(text)s;
+    }
 
     /* Panels (explicit so light mode is actually light) */
-    QWidget#LeftPanel, QWidget#RightPanel {{
-        background: {t["panel"]};
-        border: 1px solid {t["border"]};
-        border-radius: 18px;
-    }}
-
-    /* Explicit panel backgrounds (this fixes your “light mode isn’t light”) */
-    QWidget#LeftPanel, QWidget#RightPanel {{
-        background: {t["panel"]};
-        border: 1px solid {t["border"]};
+    QWidget#LeftPanel, QWidget#RightPanel {
+        background: %(panel)s;
+        border: 1px solid %(border)s;
         border-radius: 18px;
-    }}
+    }
 
-    QLabel {{ color: {t["text"]}; }}
-    #PanelTitle {{ font-size: 14px; font-weight: 900; margin-left: 2px; }}
+    QLabel { color: %(text)s; }
+    #PanelTitle { font-size: 14px; font-weight: 900; margin-left: 2px; }
 
     /* Cards */
-    QWidget#AppCard {{
-        background: {t["card"]};
-        border: 1px solid {t["border"]};
+    QWidget#AppCard {
+        background: %(card)s;
+        border: 1px solid %(border)s;
         border-radius: 18px;
-    }}
-    QLabel#CardTitle {{ font-size: 16px; font-weight: 900; }}
-    QLabel#CardMeta {{ color: {t["text_muted"]}; font-size: 12px; }}
+    }
+    QLabel#CardTitle { font-size: 16px; font-weight: 900; }
+    QLabel#CardMeta { color: %(text_muted)s; font-size: 12px; }
 
     /* General buttons */
-    QPushButton {{
-        background: {t["btn"]};
-        border: 1px solid {t["border"]};
+    QPushButton {
+        background: %(btn)s;
+        border: 1px solid %(border)s;
         padding: 8px 12px;
         border-radius: 12px;
-        color: {t["text"]};
+        color: %(text)s;
         font-weight: 800;
-    }}
-    QPushButton:hover {{
-        background: {t["btn_hover"]};
-        border: 1px solid {t["border_strong"]};
-    }}
-    QPushButton:pressed {{ background: {t["btn_pressed"]}; }}
-    QPushButton:disabled {{
-        color: {t["text_muted"]};
-        background: {t["btn_disabled"]};
-        border: 1px solid {t["border"]};
-    }}
+    }
+    QPushButton:hover {
+        background: %(btn_hover)s;
+        border: 1px solid %(border_strong)s;
+    }
+    QPushButton:pressed { background: %(btn_pressed)s; }
+    QPushButton:disabled {
+        color: %(text_muted)s;
+        background: %(btn_disabled)s;
+        border: 1px solid %(border)s;
+    }
 
     /* Small icon buttons for theme toggle */
-    QPushButton#IconButton {{
+    QPushButton#IconButton {
         padding: 6px 10px;
         border-radius: 12px;
         font-weight: 900;
-    }}
+    }
 
     /* Highlight the active theme button */
-    QPushButton#IconButton[active="true"] {{
-        background: {t["btn_hover"]};
-        border: 1px solid {t["border_strong"]};
-    }}
+    QPushButton#IconButton[active="true"] {
+        background: %(btn_hover)s;
+        border: 1px solid %(border_strong)s;
+    }
 
     /* Gradient primary buttons */
-    QPushButton#PrimaryButton {{
+    QPushButton#PrimaryButton {
         border: 0px;
         padding: 9px 14px;
         border-radius: 14px;
@@ -129,70 +124,77 @@ def build_styles(theme: str = "dark") -> str:
         font-weight: 950;
         background: qlineargradient(
             x1:0, y1:0, x2:1, y2:0,
-            stop:0 {t["grad_a"]},
-            stop:1 {t["grad_b"]}
+            stop:0 %(grad_a)s,
+            stop:1 %(grad_b)s
         );
-    }}
+    }
 
     /* Start/Stop buttons */
-    QPushButton#StartButton {{
+    QPushButton#StartButton {
         border: 0px;
         padding: 8px 12px;
         border-radius: 12px;
         color: #0B0E14;
         font-weight: 950;
-        background: {t["ok"]};
-    }}
-    QPushButton#StopButton {{
+        background: %(ok)s;
+    }
+    QPushButton#StopButton {
         border: 0px;
         padding: 8px 12px;
         border-radius: 12px;
         color: #0B0E14;
         font-weight: 950;
-        background: {t["stopped"]};
-    }}
+        background: %(stopped)s;
+    }
 
     /* Status badge */
-    QLabel#StatusBadge {{
+    QLabel#StatusBadge {
         border-radius: 12px;
         padding: 3px 10px;
         font-weight: 950;
         color: #0B0E14;
         min-width: 92px;
-    }}
-    QLabel#StatusBadge[kind="ok"]      {{ background: {t["ok"]}; }}
-    QLabel#StatusBadge[kind="stopped"] {{ background: {t["stopped"]}; }}
-    QLabel#StatusBadge[kind="warn"]    {{ background: {t["warn"]}; }}
-    QLabel#StatusBadge[kind="error"]   {{ background: {t["error"]}; }}
+    }
+    QLabel#StatusBadge[kind="ok"]      { background: %(ok)s; }
+    QLabel#StatusBadge[kind="stopped"] { background: %(stopped)s; }
+    QLabel#StatusBadge[kind="warn"]    { background: %(warn)s; }
+    QLabel#StatusBadge[kind="error"]   { background: %(error)s; }
 
     /* Log */
-    #LogView {{
-        background: {t["log_bg"]};
-        border: 1px solid {t["border"]};
+    #LogView {
+        background: %(log_bg)s;
+        border: 1px solid %(border)s;
         border-radius: 16px;
         padding: 10px;
-        color: {t["log_text"]};
+        color: %(log_text)s;
         font-family: Consolas, "Cascadia Mono", monospace;
         font-size: 12px;
-    }}
+    }
 
     /* Menus */
-    QMenuBar {{ background: {t["bg"]}; color: {t["text"]}; }}
-    QMenuBar::item {{ padding: 4px 14px; }}
-    QMenuBar::item:selected {{ background: {t["btn_hover"]}; border-radius: 6px; }}
+    QMenuBar { background: %(bg)s; color: %(text)s; }
+    QMenuBar::item { padding: 4px 14px; }
+    QMenuBar::item:selected { background: %(btn_hover)s; border-radius: 6px; }
 
-    QMenu {{ background: {t["panel"]}; color: {t["text"]}; border: 1px solid {t["border"]}; }}
-    QMenu::item {{ padding: 4px 18px; min-width: 150px; }}
-    QMenu::item:selected {{ background: {t["btn_hover"]}; }}
+    QMenu { background: %(panel)s; color: %(text)s; border: 1px solid %(border)s; }
+    QMenu::item { padding: 4px 18px; min-width: 150px; }
+    QMenu::item:selected { background: %(btn_hover)s; }
 
     /* Scroll area that holds the cards */
-    QWidget#CardsContainer {{
-        background: {t["panel"]};
-    }}
-    QScrollArea#CardsScroll {{
+    QWidget#CardsContainer {
+        background: %(panel)s;
+    }
+    QScrollArea#CardsScroll {
         background: transparent;
         border: 0px;
-    }}
+    }
 
-    QScrollArea {{ background: transparent; }}
+    QScrollArea { background: transparent; }
     """
+
+
+@lru_cache(maxsize=4)
+def build_styles(theme: str = "dark") -> str:
+    # THEMES is never modified at runtime, so each theme's stylesheet only
+    # needs to be formatted once.
+    return _QSS_TEMPLATE % THEMES.get(theme, THEMES["dark"])